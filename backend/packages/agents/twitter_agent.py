@@ -15,6 +15,10 @@ from .base import BrowserAgent
 
 logger = logging.getLogger(__name__)
 
+# Engagement count suffixes ("1.2K", "3.5M") and the separators X inserts ("1,234")
+_METRIC_MULTIPLIERS = {'K': 1_000, 'M': 1_000_000, 'B': 1_000_000_000}
+_METRIC_STRIP = str.maketrans('', '', ', ')
+
 
 class TwitterAgent(BrowserAgent):
     """
@@ -103,18 +107,13 @@ class TwitterAgent(BrowserAgent):
                 # Extract visible tweets
                 tweet_elements = await self._page.query_selector_all('[data-testid="tweet"]')
                 
-                for element in tweet_elements:
+                for post in await self._extract_posts(tweet_elements, "timeline"):
                     if len(posts) >= limit:
                         break
                     
-                    try:
-                        post = await self._extract_post_from_element(element)
-                        if post and post['id'] not in seen_ids:
-                            seen_ids.add(post['id'])
-                            posts.append(post)
-                    except Exception as e:
-                        logger.warning(f"Error extracting tweet from timeline: {e}")
-                        continue
+                    if post['id'] not in seen_ids:
+                        seen_ids.add(post['id'])
+                        posts.append(post)
                 
                 if len(posts) >= limit:
                     break
@@ -163,18 +162,13 @@ class TwitterAgent(BrowserAgent):
             for _ in range(3):  # Scroll 3 times
                 tweet_elements = await self._page.query_selector_all('[data-testid="tweet"]')
                 
-                for element in tweet_elements:
+                for post in await self._extract_posts(tweet_elements, "user profile"):
                     if len(posts) >= limit:
                         break
                     
-                    try:
-                        post = await self._extract_post_from_element(element)
-                        if post and post['id'] not in seen_ids:
-                            seen_ids.add(post['id'])
-                            posts.append(post)
-                    except Exception as e:
-                        logger.warning(f"Error extracting tweet from user profile: {e}")
-                        continue
+                    if post['id'] not in seen_ids:
+                        seen_ids.add(post['id'])
+                        posts.append(post)
                 
                 if len(posts) >= limit:
                     break
@@ -188,6 +182,35 @@ class TwitterAgent(BrowserAgent):
             logger.error(f"Error fetching posts from @{username}: {e}")
             return []
     
+    async def _extract_posts(self, elements, source: str) -> List[Dict[str, Any]]:
+        """
+        Extract posts from tweet elements concurrently.
+        
+        Each extraction is several browser round trips, so they are
+        overlapped rather than awaited one element at a time.
+        
+        Args:
+            elements: Playwright element handles
+            source: Where the elements came from (for log messages)
+            
+        Returns:
+            Extracted posts, in element order
+        """
+        results = await asyncio.gather(
+            *(self._extract_post_from_element(element) for element in elements),
+            return_exceptions=True,
+        )
+        
+        posts = []
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Error extracting tweet from {source}: {result}")
+            elif isinstance(result, BaseException):
+                raise result  # e.g. cancellation
+            elif result:
+                posts.append(result)
+        return posts
+    
     async def _extract_post_from_element(self, element) -> Optional[Dict[str, Any]]:
         """
         Extract post data from tweet element.
@@ -283,17 +306,16 @@ class TwitterAgent(BrowserAgent):
             return None
     
     def _parse_metric(self, text: str) -> int:
-        """Parse engagement metric (handles K, M suffixes)"""
-        text = text.strip().upper()
-        if not text or text == '':
+        """Parse engagement metric (handles K, M, B suffixes and commas)"""
+        text = text.strip().translate(_METRIC_STRIP)
+        if not text:
             return 0
         
+        multiplier = _METRIC_MULTIPLIERS.get(text[-1].upper())
+        if multiplier is not None:
+            text = text[:-1]
+        
         try:
-            if 'K' in text:
-                return int(float(text.replace('K', '')) * 1000)
-            elif 'M' in text:
-                return int(float(text.replace('M', '')) * 1000000)
-            else:
-                return int(text)
-        except Exception:
+            return int(float(text) * (multiplier or 1))
+        except (ValueError, OverflowError):
             return 0
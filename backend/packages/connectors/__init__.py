@@ -1,16 +1,33 @@
 """MCP Connectors for Google Workspace"""
+from importlib import import_module
+
 from .base import BaseConnector, ConnectorResult
-from .gmail import GmailConnector
-from .calendar import CalendarConnector
-from .tasks import TasksConnector
-from .keep import KeepConnector
-from .research import ResearchConnector
-from .news import NewsConnector
-from .flights import FlightsConnector
-from .dining import DiningConnector
-from .travel import TravelConnector
-from .local import LocalConnector
-from .shopping import ShoppingConnector
+
+# Connector classes are imported on first access so that importing
+# packages.connectors.base (normalizer, tests) does not load every provider SDK.
+_LAZY_CONNECTORS = {
+    "GmailConnector": ".gmail",
+    "CalendarConnector": ".calendar",
+    "TasksConnector": ".tasks",
+    "KeepConnector": ".keep",
+    "ResearchConnector": ".research",
+    "NewsConnector": ".news",
+    "FlightsConnector": ".flights",
+    "DiningConnector": ".dining",
+    "TravelConnector": ".travel",
+    "LocalConnector": ".local",
+    "ShoppingConnector": ".shopping",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_CONNECTORS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    connector_cls = getattr(import_module(module_name, __name__), name)
+    globals()[name] = connector_cls
+    return connector_cls
+
 
 __all__ = [
     "BaseConnector",
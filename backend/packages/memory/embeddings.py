@@ -4,11 +4,15 @@ Embedding Generation Service
 Provides unified interface for generating text embeddings using multiple backends:
 - OpenAI embeddings (production)
 - Sentence transformers (local/dev)
+- Model2Vec static embeddings (local, CPU-cheap)
 """
 
+import hashlib
+import math
 import os
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from collections import OrderedDict
+from typing import Dict, List, Optional
 
 import numpy as np
 
@@ -68,7 +72,10 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
 class SentenceTransformerProvider(EmbeddingProvider):
     """Local sentence transformers (all-MiniLM-L6-v2)"""
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    # int8 ONNX export shipped in the sentence-transformers model repos
+    QUANTIZED_ONNX_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", quantized: bool = False):
         """
         Initialize sentence transformer model
 
@@ -76,6 +83,9 @@ class SentenceTransformerProvider(EmbeddingProvider):
             model_name: HuggingFace model name
                 - all-MiniLM-L6-v2: Fast, 384 dim (default)
                 - all-mpnet-base-v2: Better quality, 768 dim
+            quantized: Run the int8 ONNX export (AVX512-VNNI) instead of
+                PyTorch FP32. Faster on CPU, but vectors differ slightly, so
+                don't mix both modes in one Qdrant collection.
         """
         try:
             from sentence_transformers import SentenceTransformer
@@ -85,7 +95,24 @@ class SentenceTransformerProvider(EmbeddingProvider):
             )
 
         self.model_name = model_name
-        self.model = SentenceTransformer(model_name)
+        self.quantized = quantized
+
+        if quantized:
+            try:
+                self.model = SentenceTransformer(
+                    model_name,
+                    backend="onnx",
+                    model_kwargs={"file_name": self.QUANTIZED_ONNX_FILE},
+                )
+            except TypeError:
+                # backend= was added in sentence-transformers 3.2
+                raise ImportError(
+                    "Quantized embeddings need sentence-transformers>=3.2. "
+                    "Run: pip install 'sentence-transformers[onnx]>=3.2'"
+                )
+        else:
+            self.model = SentenceTransformer(model_name)
+
         self._dimension = self.model.get_sentence_embedding_dimension()
 
     def embed_text(self, text: str) -> List[float]:
@@ -102,30 +129,84 @@ class SentenceTransformerProvider(EmbeddingProvider):
         return self._dimension
 
 
+class Model2VecProvider(EmbeddingProvider):
+    """Model2Vec static embeddings (potion-base-8M)"""
+
+    def __init__(self, model_name: str = "minishlab/potion-base-8M"):
+        """
+        Initialize Model2Vec model
+
+        Static token embeddings distilled from a sentence transformer and
+        mean-pooled without attention. Much faster than MiniLM on CPU with a
+        small quality loss, which is fine for title/summary deduplication.
+
+        Args:
+            model_name: HuggingFace model name
+                - minishlab/potion-base-8M: 256 dim (default)
+        """
+        try:
+            from model2vec import StaticModel
+        except ImportError:
+            raise ImportError("model2vec not installed. Run: pip install model2vec")
+
+        self.model_name = model_name
+        self.model = StaticModel.from_pretrained(model_name)
+        self._dimension = self.model.dim
+
+    def embed_text(self, text: str) -> List[float]:
+        """Generate embedding for single text"""
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Generate embeddings for batch of texts"""
+        embeddings = self.model.encode(texts)
+        return np.asarray(embeddings, dtype=np.float32).tolist()
+
+    def get_dimension(self) -> int:
+        return self._dimension
+
+
 class EmbeddingService:
     """
     Unified embedding service with automatic provider selection
 
     Tries providers in order:
-    1. OpenAI (if OPENAI_API_KEY set)
-    2. SentenceTransformers (local fallback)
+    1. Model2Vec (if EMBEDDING_PROVIDER=model2vec)
+    2. OpenAI (if OPENAI_API_KEY set)
+    3. SentenceTransformers (local fallback)
     """
 
-    def __init__(self, provider: Optional[EmbeddingProvider] = None):
+    def __init__(self, provider: Optional[EmbeddingProvider] = None, cache_size: int = 10_000):
         """
         Initialize embedding service
 
         Args:
             provider: Optional explicit provider. If None, auto-detect.
+            cache_size: Max embeddings kept in the LRU cache (0 disables it)
         """
         if provider:
             self.provider = provider
         else:
             self.provider = self._auto_detect_provider()
 
+        # LRU of float32 rows keyed by a digest of the text (~1.5 KB per 384-dim entry)
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+
     def _auto_detect_provider(self) -> EmbeddingProvider:
         """Auto-detect and initialize best available provider"""
 
+        # Static embeddings when explicitly requested. Don't fall back: other
+        # providers have a different dimension than the stored vectors.
+        if os.getenv("EMBEDDING_PROVIDER", "").lower() == "model2vec":
+            try:
+                return Model2VecProvider()
+            except ImportError as e:
+                raise RuntimeError(
+                    "EMBEDDING_PROVIDER=model2vec but model2vec is not installed. "
+                    "Run: pip install model2vec"
+                ) from e
+
         # Try OpenAI first (production)
         if os.getenv("OPENAI_API_KEY"):
             try:
@@ -135,7 +216,9 @@ class EmbeddingService:
 
         # Fallback to sentence transformers (local)
         try:
-            return SentenceTransformerProvider()
+            return SentenceTransformerProvider(
+                quantized=os.getenv("EMBEDDING_QUANTIZED", "").lower() in ("1", "true")
+            )
         except ImportError:
             raise RuntimeError(
                 "No embedding provider available. Install openai or sentence-transformers."
@@ -155,7 +238,13 @@ class EmbeddingService:
             # Return zero vector for empty text
             return [0.0] * self.get_dimension()
 
-        return self.provider.embed_text(text)
+        key = self._cache_key(text)
+        row = self._cache_get(key)
+        if row is None:
+            row = np.asarray(self.provider.embed_text(text), dtype=np.float32)
+            self._cache_put(key, row)
+
+        return row.tolist()
 
     def embed_batch(self, texts: List[str]) -> List[List[float]]:
         """
@@ -170,25 +259,82 @@ class EmbeddingService:
         if not texts:
             return []
 
-        # Filter out empty texts but preserve indices
-        filtered_texts = []
-        empty_indices = []
+        return [row.tolist() for row in self._embed_rows(texts)]
 
-        for i, text in enumerate(texts):
-            if text and text.strip():
-                filtered_texts.append(text)
-            else:
-                empty_indices.append(i)
+    def embed_matrix(self, texts: List[str], normalize: bool = False) -> np.ndarray:
+        """
+        Generate embeddings for multiple texts as one contiguous float32 matrix
+
+        Args:
+            texts: List of texts to embed
+            normalize: L2-normalize rows so cosine similarity becomes a dot product
+
+        Returns:
+            Array of shape (len(texts), dimension); empty texts get zero rows
+        """
+        matrix = np.empty((len(texts), self.get_dimension()), dtype=np.float32)
+        if texts:
+            matrix[:] = self._embed_rows(texts)
+
+        if normalize:
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            np.divide(matrix, norms, out=matrix, where=norms > 0)
 
-        # Get embeddings for non-empty texts
-        embeddings = self.provider.embed_batch(filtered_texts) if filtered_texts else []
+        return matrix
 
-        # Insert zero vectors for empty texts
-        zero_vector = [0.0] * self.get_dimension()
-        for idx in empty_indices:
-            embeddings.insert(idx, zero_vector)
+    def _embed_rows(self, texts: List[str]) -> List[np.ndarray]:
+        """
+        Look up float32 embeddings for texts, embedding all cache misses
+        in a single provider call. Empty texts map to a zero row.
+        """
+        rows: List[Optional[np.ndarray]] = [None] * len(texts)
+        misses: Dict[bytes, List[int]] = {}
+        miss_texts: List[str] = []
 
-        return embeddings
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                continue
+
+            key = self._cache_key(text)
+            row = self._cache_get(key)
+            if row is not None:
+                rows[i] = row
+            elif key in misses:
+                misses[key].append(i)
+            else:
+                misses[key] = [i]
+                miss_texts.append(text)
+
+        if miss_texts:
+            embeddings = self.provider.embed_batch(miss_texts)
+            for (key, indices), embedding in zip(misses.items(), embeddings):
+                row = np.asarray(embedding, dtype=np.float32)
+                self._cache_put(key, row)
+                for i in indices:
+                    rows[i] = row
+
+        if any(row is None for row in rows):
+            zero_row = np.zeros(self.get_dimension(), dtype=np.float32)
+            rows = [zero_row if row is None else row for row in rows]
+
+        return rows
+
+    @staticmethod
+    def _cache_key(text: str) -> bytes:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def _cache_get(self, key: bytes) -> Optional[np.ndarray]:
+        row = self._cache.get(key)
+        if row is not None:
+            self._cache.move_to_end(key)
+        return row
+
+    def _cache_put(self, key: bytes, row: np.ndarray):
+        if self.cache_size <= 0:
+            return
+        self._cache[key] = row
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
 
     def get_dimension(self) -> int:
         """Get embedding vector dimension"""
@@ -205,19 +351,35 @@ class EmbeddingService:
         Returns:
             Similarity score 0.0-1.0 (1.0 = identical)
         """
-        # Convert to numpy for efficient computation
-        v1 = np.array(vec1)
-        v2 = np.array(vec2)
+        # float32 matches the providers' output precision and keeps the dots in BLAS sdot
+        v1 = np.asarray(vec1, dtype=np.float32)
+        v2 = np.asarray(vec2, dtype=np.float32)
 
-        # Compute cosine similarity
-        dot_product = np.dot(v1, v2)
-        norm1 = np.linalg.norm(v1)
-        norm2 = np.linalg.norm(v2)
-
-        if norm1 == 0 or norm2 == 0:
+        # Squared norms via dot products; one sqrt instead of two np.linalg.norm calls
+        norms_sq = float(np.dot(v1, v1)) * float(np.dot(v2, v2))
+        if norms_sq == 0:
             return 0.0
 
-        return float(dot_product / (norm1 * norm2))
+        return float(np.dot(v1, v2)) / math.sqrt(norms_sq)
+
+    def cosine_similarity_batch(self, query: List[float], matrix: np.ndarray) -> np.ndarray:
+        """
+        Calculate cosine similarity between a vector and every row of a matrix
+
+        Args:
+            query: Embedding vector
+            matrix: Embeddings, one per row (e.g. from embed_matrix)
+
+        Returns:
+            float32 array of similarity scores, 0.0 for zero vectors
+        """
+        q = np.asarray(query, dtype=np.float32)
+        m = np.asarray(matrix, dtype=np.float32)
+
+        dots = m @ q
+        norms = np.linalg.norm(m, axis=1) * np.linalg.norm(q)
+
+        return np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
 
 
 # Singleton instance for easy import
@@ -15,11 +15,25 @@ Example:
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from operator import itemgetter
 from typing import Dict, List, Optional, Set
 
 from packages.shared.schemas import BriefItem, Entity
 
 
+# Status keyword -> status, in priority order (first match wins)
+_STATUS_KEYWORDS = (
+    ("launch", "launched"),
+    ("release", "released"),
+    ("announce", "announced"),
+    ("delay", "delayed"),
+    ("cancel", "cancelled"),
+    ("complete", "completed"),
+    ("start", "started"),
+    ("end", "ended"),
+)
+
+
 @dataclass
 class EntityState:
     """Tracks state of an entity over time"""
@@ -170,20 +184,9 @@ class EntityTracker:
         updates = []
 
         # Check for status keywords in title/summary
-        status_keywords = {
-            "launch": "launched",
-            "release": "released",
-            "announce": "announced",
-            "delay": "delayed",
-            "cancel": "cancelled",
-            "complete": "completed",
-            "start": "started",
-            "end": "ended",
-        }
-
         text = f"{item.title} {item.summary}".lower()
 
-        for keyword, status in status_keywords.items():
+        for keyword, status in _STATUS_KEYWORDS:
             if keyword in text:
                 old_status = state.attributes.get("status")
                 if old_status != status:
@@ -266,28 +269,41 @@ class EntityTracker:
             List of EntityState objects
         """
         cutoff = datetime.now(timezone.utc).timestamp() - (days * 24 * 3600)
-        active = []
 
-        for state in self._entities[user_id].values():
-            if state.last_seen.timestamp() >= cutoff:
-                active.append(state)
+        # Convert each last_seen once; the sort reuses the same timestamps
+        active = [
+            (last_seen, state)
+            for state in self._entities[user_id].values()
+            if (last_seen := state.last_seen.timestamp()) >= cutoff
+        ]
+        active.sort(key=itemgetter(0), reverse=True)
 
-        return sorted(active, key=lambda s: s.last_seen, reverse=True)
+        return [state for _, state in active]
 
     def get_stats(self, user_id: str) -> Dict:
         """Get statistics about tracked entities"""
         entities = self._entities[user_id]
 
-        # Count by kind
+        # Single pass: kind counts and both activity windows, no sorting
+        now = datetime.now(timezone.utc).timestamp()
+        cutoff_7d = now - 7 * 24 * 3600
+        cutoff_30d = now - 30 * 24 * 3600
+
         by_kind = defaultdict(int)
+        active_7d = active_30d = 0
         for state in entities.values():
             by_kind[state.entity_kind] += 1
+            last_seen = state.last_seen.timestamp()
+            if last_seen >= cutoff_30d:
+                active_30d += 1
+                if last_seen >= cutoff_7d:
+                    active_7d += 1
 
         return {
             "total_entities": len(entities),
             "by_kind": dict(by_kind),
-            "active_last_7d": len(self.get_active_entities(user_id, days=7)),
-            "active_last_30d": len(self.get_active_entities(user_id, days=30)),
+            "active_last_7d": active_7d,
+            "active_last_30d": active_30d,
         }
 
     def clear_user_data(self, user_id: str):
@@ -12,7 +12,7 @@ This provides multi-layered duplicate detection:
 - Level 3: Entity tracking (detects meaningful updates about known topics)
 """
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timezone
@@ -34,7 +34,6 @@ class EnhancedNoveltyLabel(str, Enum):
     ENTITY_UPDATE = "ENTITY_UPDATE"  # New info about known entity
 
 
-@dataclass
 class EnhancedNoveltyInfo(NoveltyInfo):
     """Extended novelty info with semantic and entity details"""
     
@@ -167,16 +166,49 @@ class EnhancedNoveltyDetector:
         # First pass: Base fingerprint novelty
         items_with_base = self.base_detector.detect_novelty_batch(user_id, items, items_data)
 
-        # Second pass: Semantic + entity analysis
+        fingerprints = []
         for i, item in enumerate(items_with_base):
             item_data = items_data[i] if items_data and i < len(items_data) else None
 
             # Generate fingerprint
             if item_data:
-                fingerprint = generate_fingerprint(item.source, item.type, item_data)
+                fingerprints.append(generate_fingerprint(item.source, item.type, item_data))
             else:
-                fingerprint = f"{item.source}:{item.item_ref}"
+                fingerprints.append(f"{item.source}:{item.item_ref}")
+
+        # Semantic check (if NEW and enabled) for the whole batch at once
+        semantic_indices = [
+            i
+            for i, item in enumerate(items_with_base)
+            if self.enable_semantic and item.novelty.label == NoveltyLabel.NEW.value
+        ]
+
+        # Embedding and the Qdrant round-trip run in a worker thread (numpy,
+        # the embedding backend and socket I/O release the GIL) while entity
+        # tracking runs here; the two passes don't share state
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            semantic_future = None
+            if semantic_indices:
+                semantic_future = executor.submit(
+                    self.semantic_dedup.batch_check_duplicates,
+                    user_id,
+                    [(items_with_base[i], fingerprints[i]) for i in semantic_indices],
+                )
 
+            # Entity tracking (if enabled)
+            entity_results = [
+                self.entity_tracker.track_item(user_id, item, fingerprint)
+                if self.enable_entity_tracking
+                else None
+                for item, fingerprint in zip(items_with_base, fingerprints)
+            ]
+
+            semantic_results = (
+                dict(zip(semantic_indices, semantic_future.result())) if semantic_future else {}
+            )
+
+        # Second pass: Combine semantic + entity analysis
+        for i, item in enumerate(items_with_base):
             # Get base novelty
             base_novelty = item.novelty
 
@@ -189,30 +221,24 @@ class EnhancedNoveltyDetector:
                 seen_count=base_novelty.seen_count,
             )
 
-            # Semantic check (if NEW and enabled)
-            if self.enable_semantic and base_novelty.label == NoveltyLabel.NEW.value:
-                semantic_result = self.semantic_dedup.check_and_add(user_id, item, fingerprint)
-
-                if semantic_result.is_duplicate:
-                    enhanced_info.label = EnhancedNoveltyLabel.SEMANTIC_DUPLICATE.value
-                    enhanced_info.reason = semantic_result.reason
-                    enhanced_info.semantic_similarity = semantic_result.max_similarity
-
-                    if semantic_result.similar_items:
-                        enhanced_info.similar_to = semantic_result.similar_items[0].fingerprint
+            semantic_result = semantic_results.get(i)
+            if semantic_result and semantic_result.is_duplicate:
+                enhanced_info.label = EnhancedNoveltyLabel.SEMANTIC_DUPLICATE.value
+                enhanced_info.reason = semantic_result.reason
+                enhanced_info.semantic_similarity = semantic_result.max_similarity
 
-            # Entity tracking (if enabled)
-            if self.enable_entity_tracking:
-                entity_result = self.entity_tracker.track_item(user_id, item, fingerprint)
+                if semantic_result.similar_items:
+                    enhanced_info.similar_to = semantic_result.similar_items[0].fingerprint
 
-                if entity_result.has_updates:
-                    if enhanced_info.label == NoveltyLabel.REPEAT.value:
-                        enhanced_info.label = EnhancedNoveltyLabel.ENTITY_UPDATE.value
-                        enhanced_info.reason = entity_result.summary
+            entity_result = entity_results[i]
+            if entity_result and entity_result.has_updates:
+                if enhanced_info.label == NoveltyLabel.REPEAT.value:
+                    enhanced_info.label = EnhancedNoveltyLabel.ENTITY_UPDATE.value
+                    enhanced_info.reason = entity_result.summary
 
-                    enhanced_info.entity_updates = [
-                        update.description for update in entity_result.entity_updates
-                    ]
+                enhanced_info.entity_updates = [
+                    update.description for update in entity_result.entity_updates
+                ]
 
             # Update item with enhanced info
             item.novelty = enhanced_info
@@ -12,16 +12,44 @@ Example:
     → Detected as duplicates (similarity > 0.85)
 """
 
+import hashlib
 import os
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Tuple
 
 from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, PointStruct, VectorParams
+from qdrant_client.models import (
+    Distance,
+    FieldCondition,
+    Filter,
+    HnswConfigDiff,
+    PayloadSchemaType,
+    PointStruct,
+    QuantizationSearchParams,
+    Range,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+    VectorParams,
+)
 
 from packages.memory.embeddings import EmbeddingService, get_embedding_service
 from packages.shared.schemas import BriefItem
+from packages.shared.timeutils import parse_iso_timestamp
+
+# Payload fields read back from search hits; search_text and type are only
+# stored for debugging, so they are not sent over the wire on every search
+_RESULT_PAYLOAD_FIELDS = ["fingerprint", "title", "source", "timestamp_utc"]
+
+
+def _epoch_ns(dt: datetime) -> int:
+    """Integer nanoseconds since the epoch, exact to the microsecond"""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    delta = dt - datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1_000
 
 
 @dataclass
@@ -56,12 +84,26 @@ class SemanticDeduplicator:
     - Configurable similarity threshold
     """
 
+    # Keep the long-lived gRPC channel open between briefs and allow large
+    # search_batch responses (default gRPC limit is 4 MB)
+    GRPC_OPTIONS = {
+        "grpc.keepalive_time_ms": 30_000,
+        "grpc.max_receive_message_length": 64 * 1024 * 1024,
+    }
+
     def __init__(
         self,
         qdrant_url: Optional[str] = None,
         embedding_service: Optional[EmbeddingService] = None,
         similarity_threshold: float = 0.85,
         search_limit: int = 5,
+        hnsw_m: int = 24,
+        hnsw_ef_construct: int = 128,
+        hnsw_ef: int = 100,
+        quantize: bool = True,
+        window_days: Optional[int] = None,
+        prefer_grpc: Optional[bool] = None,
+        grpc_port: Optional[int] = None,
     ):
         """
         Initialize semantic deduplicator
@@ -71,14 +113,49 @@ class SemanticDeduplicator:
             embedding_service: Embedding service (default: auto-detect)
             similarity_threshold: Min similarity to consider duplicate (0.0-1.0)
             search_limit: Max similar items to return
+            hnsw_m: HNSW graph degree for new collections (Qdrant default: 16)
+            hnsw_ef_construct: HNSW build beam width for new collections (default: 100)
+            hnsw_ef: HNSW search beam width per query
+            quantize: Keep an int8 copy of vectors in RAM for new collections;
+                searches rescore the candidates against the original vectors
+            window_days: Only compare against items from the last N days
+                (default: all stored items)
+            prefer_grpc: Talk to Qdrant over gRPC (HTTP/2, protobuf) instead of REST
+                (default: from QDRANT_PREFER_GRPC env, off; needs the gRPC port reachable)
+            grpc_port: Qdrant gRPC port (default: from QDRANT_GRPC_PORT env, 6334)
         """
         self.qdrant_url = qdrant_url or os.getenv("QDRANT_URL", "http://localhost:6333")
         self.embedding_service = embedding_service or get_embedding_service()
         self.similarity_threshold = similarity_threshold
         self.search_limit = search_limit
+        self.window_days = window_days
+        self.hnsw_config = HnswConfigDiff(m=hnsw_m, ef_construct=hnsw_ef_construct)
+        self.quantization_config = (
+            ScalarQuantization(
+                scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)
+            )
+            if quantize
+            else None
+        )
+        # Ignored by collections created without quantization
+        self.search_params = SearchParams(
+            hnsw_ef=hnsw_ef,
+            quantization=QuantizationSearchParams(rescore=True, oversampling=2.0),
+        )
 
-        # Initialize Qdrant client
-        self.client = QdrantClient(url=self.qdrant_url)
+        if prefer_grpc is None:
+            prefer_grpc = os.getenv("QDRANT_PREFER_GRPC", "").lower() in ("1", "true")
+        if grpc_port is None:
+            grpc_port = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
+
+        # Initialize Qdrant client; share one instance per process
+        # (get_semantic_deduplicator) so the channel stays warm
+        self.client = QdrantClient(
+            url=self.qdrant_url,
+            prefer_grpc=prefer_grpc,
+            grpc_port=grpc_port,
+            grpc_options=self.GRPC_OPTIONS if prefer_grpc else None,
+        )
 
         # Cache embedding dimension
         self._embedding_dim = self.embedding_service.get_dimension()
@@ -103,7 +180,23 @@ class SemanticDeduplicator:
                     size=self._embedding_dim,
                     distance=Distance.COSINE,
                 ),
+                hnsw_config=self.hnsw_config,
+                quantization_config=self.quantization_config,
             )
+            # Integer index so time-window filters are a range scan
+            self.client.create_payload_index(
+                collection_name=collection_name,
+                field_name="timestamp_ns",
+                field_schema=PayloadSchemaType.INTEGER,
+            )
+
+    def _search_filter(self) -> Optional[Filter]:
+        """Restrict searches to the dedup window, if one is configured"""
+        if self.window_days is None:
+            return None
+
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self.window_days)
+        return Filter(must=[FieldCondition(key="timestamp_ns", range=Range(gte=_epoch_ns(cutoff)))])
 
     def _generate_search_text(self, item: BriefItem) -> str:
         """
@@ -122,7 +215,11 @@ class SemanticDeduplicator:
         return " ".join(parts).strip()
 
     def check_duplicate(
-        self, user_id: str, item: BriefItem, fingerprint: str
+        self,
+        user_id: str,
+        item: BriefItem,
+        fingerprint: str,
+        embedding: Optional[List[float]] = None,
     ) -> SemanticDuplicateResult:
         """
         Check if item is semantically similar to existing items
@@ -131,6 +228,7 @@ class SemanticDeduplicator:
             user_id: User ID
             item: Item to check
             fingerprint: Item fingerprint
+            embedding: Precomputed embedding of the item's search text
 
         Returns:
             SemanticDuplicateResult with duplicate status and similar items
@@ -149,7 +247,8 @@ class SemanticDeduplicator:
             )
 
         # Generate embedding
-        embedding = self.embedding_service.embed_text(search_text)
+        if embedding is None:
+            embedding = self.embedding_service.embed_text(search_text)
 
         # Search for similar items
         try:
@@ -157,6 +256,9 @@ class SemanticDeduplicator:
                 collection_name=collection_name,
                 query_vector=embedding,
                 limit=self.search_limit,
+                query_filter=self._search_filter(),
+                search_params=self.search_params,
+                with_payload=_RESULT_PAYLOAD_FIELDS,
                 score_threshold=self.similarity_threshold * 0.8,  # Lower threshold for search
             )
         except Exception as e:
@@ -168,7 +270,10 @@ class SemanticDeduplicator:
                 reason=f"Search error: {str(e)}",
             )
 
-        # Process results
+        return self._build_result(self._similar_from_hits(search_results, fingerprint))
+
+    def _similar_from_hits(self, search_results, fingerprint: str) -> List[SimilarItem]:
+        """Convert Qdrant hits to SimilarItems, skipping the item itself"""
         similar_items = []
         for result in search_results:
             # Skip if it's the same fingerprint
@@ -184,7 +289,10 @@ class SemanticDeduplicator:
             )
             similar_items.append(similar_item)
 
-        # Determine if duplicate
+        return similar_items
+
+    def _build_result(self, similar_items: List[SimilarItem]) -> SemanticDuplicateResult:
+        """Decide duplicate status from similar items ordered by similarity"""
         max_similarity = max([item.similarity for item in similar_items], default=0.0)
         is_duplicate = max_similarity >= self.similarity_threshold
 
@@ -207,6 +315,7 @@ class SemanticDeduplicator:
         user_id: str,
         item: BriefItem,
         fingerprint: str,
+        embedding: Optional[List[float]] = None,
     ):
         """
         Add item to vector database for future similarity checks
@@ -215,6 +324,7 @@ class SemanticDeduplicator:
             user_id: User ID
             item: Item to add
             fingerprint: Item fingerprint
+            embedding: Precomputed embedding of the item's search text
         """
         self._ensure_collection_exists(user_id)
         collection_name = self._get_collection_name(user_id)
@@ -224,28 +334,45 @@ class SemanticDeduplicator:
         if not search_text:
             return  # Nothing to index
 
-        embedding = self.embedding_service.embed_text(search_text)
+        if embedding is None:
+            embedding = self.embedding_service.embed_text(search_text)
+
+        # Upsert point (update if exists, create if not)
+        self.client.upsert(
+            collection_name=collection_name,
+            points=[self._make_point(item, fingerprint, search_text, embedding)],
+        )
+
+    @staticmethod
+    def _point_id(fingerprint: str) -> int:
+        """
+        Stable uint64 point ID for a fingerprint
 
-        # Create point
-        point = PointStruct(
-            id=hash(fingerprint) & 0x7FFFFFFFFFFFFFFF,  # Convert to positive int64
+        Derived from a BLAKE2b digest so re-adding an item upserts the same
+        point from any process (built-in hash() is salted per interpreter).
+        """
+        digest = hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "big")
+
+    def _make_point(
+        self, item: BriefItem, fingerprint: str, search_text: str, embedding: List[float]
+    ) -> PointStruct:
+        """Build the Qdrant point stored for an item"""
+        timestamp = parse_iso_timestamp(item.timestamp_utc)
+        return PointStruct(
+            id=self._point_id(fingerprint),
             vector=embedding,
             payload={
                 "fingerprint": fingerprint,
                 "title": item.title,
                 "source": item.source,
                 "type": item.type,
-                "timestamp_utc": item.timestamp_utc.isoformat(),
+                "timestamp_utc": timestamp.isoformat(),
+                "timestamp_ns": _epoch_ns(timestamp),
                 "search_text": search_text[:500],  # Store excerpt for debugging
             },
         )
 
-        # Upsert point (update if exists, create if not)
-        self.client.upsert(
-            collection_name=collection_name,
-            points=[point],
-        )
-
     def check_and_add(
         self, user_id: str, item: BriefItem, fingerprint: str
     ) -> SemanticDuplicateResult:
@@ -262,11 +389,15 @@ class SemanticDeduplicator:
         Returns:
             SemanticDuplicateResult
         """
-        result = self.check_duplicate(user_id, item, fingerprint)
+        # Embed once for both the search and the upsert
+        search_text = self._generate_search_text(item)
+        embedding = self.embedding_service.embed_text(search_text) if search_text else None
+
+        result = self.check_duplicate(user_id, item, fingerprint, embedding)
 
         # Add to database if not duplicate
         if not result.is_duplicate:
-            self.add_item(user_id, item, fingerprint)
+            self.add_item(user_id, item, fingerprint, embedding)
 
         return result
 
@@ -283,18 +414,139 @@ class SemanticDeduplicator:
         Returns:
             List of SemanticDuplicateResults (same order as input)
         """
-        results = []
+        if not items:
+            return []
+
+        self._ensure_collection_exists(user_id)
+        collection_name = self._get_collection_name(user_id)
+
+        # One provider call for the whole batch into a normalized float32
+        # matrix (Qdrant normalizes COSINE vectors anyway), so in-batch
+        # similarities are dot products. Rows are converted to lists once
+        # and shared by the search requests and the upserted points. Items
+        # without searchable text get a zero row that is never used.
+        texts = [self._generate_search_text(item) for item, _ in items]
+        vectors = self.embedding_service.embed_matrix(texts, normalize=True)
+        embeddings = [row.tolist() for row in vectors]
+        searchable = [i for i, text in enumerate(texts) if text]
+
+        try:
+            # SearchRequest/search_batch belong to the pinned qdrant-client 1.7
+            # API; looked up here so the module loads against newer clients too
+            from qdrant_client.models import SearchRequest
+
+            search_batch = self.client.search_batch
+        except (ImportError, AttributeError):
+            return self._check_duplicates_sequentially(user_id, items, embeddings)
+
+        # One search RPC for the whole batch instead of one per item
+        hits: Dict[int, list] = {}
+        search_error: Optional[Exception] = None
+        if searchable:
+            search_filter = self._search_filter()
+            requests = [
+                SearchRequest(
+                    vector=embeddings[i],
+                    filter=search_filter,
+                    limit=self.search_limit,
+                    with_payload=_RESULT_PAYLOAD_FIELDS,
+                    params=self.search_params,
+                    score_threshold=self.similarity_threshold * 0.8,  # Lower threshold for search
+                )
+                for i in searchable
+            ]
+            try:
+                batch_results = search_batch(
+                    collection_name=collection_name,
+                    requests=requests,
+                )
+                hits = dict(zip(searchable, batch_results))
+            except Exception as e:
+                # Collection might be empty or not exist yet
+                search_error = e
+
+        results: List[SemanticDuplicateResult] = []
+        points: List[PointStruct] = []
+        # Items accepted earlier in this batch are not in Qdrant yet, so
+        # later items are also compared against them in-process
+        accepted: List[int] = []
+
+        for i, (item, fingerprint) in enumerate(items):
+            if not texts[i]:
+                results.append(
+                    SemanticDuplicateResult(
+                        is_duplicate=False,
+                        similar_items=[],
+                        max_similarity=0.0,
+                        reason="No searchable content",
+                    )
+                )
+                continue
+
+            if search_error is not None:
+                result = SemanticDuplicateResult(
+                    is_duplicate=False,
+                    similar_items=[],
+                    max_similarity=0.0,
+                    reason=f"Search error: {str(search_error)}",
+                )
+            else:
+                similar_items = self._similar_from_hits(hits.get(i, []), fingerprint)
+
+                if accepted:
+                    scores = vectors[accepted] @ vectors[i]
+                    for j, score in zip(accepted, scores):
+                        other, other_fingerprint = items[j]
+                        if score < self.similarity_threshold * 0.8 or other_fingerprint == fingerprint:
+                            continue
+                        similar_items.append(
+                            SimilarItem(
+                                fingerprint=other_fingerprint,
+                                similarity=float(score),
+                                title=other.title,
+                                source=other.source,
+                                timestamp_utc=parse_iso_timestamp(other.timestamp_utc),
+                            )
+                        )
+                    similar_items.sort(key=lambda s: s.similarity, reverse=True)
+
+                result = self._build_result(similar_items)
 
-        for item, fingerprint in items:
-            result = self.check_duplicate(user_id, item, fingerprint)
             results.append(result)
 
-            # Add non-duplicates to database
+            # Collect non-duplicates for a single upsert
             if not result.is_duplicate:
-                self.add_item(user_id, item, fingerprint)
+                accepted.append(i)
+                points.append(self._make_point(item, fingerprint, texts[i], embeddings[i]))
+
+        if points:
+            self.client.upsert(
+                collection_name=collection_name,
+                points=points,
+            )
 
         return results
 
+    def _check_duplicates_sequentially(
+        self,
+        user_id: str,
+        items: List[Tuple[BriefItem, str]],
+        embeddings: List[List[float]],
+    ) -> List[SemanticDuplicateResult]:
+        """
+        Fallback for clients without search_batch: check_and_add per item
+
+        Each accepted item is upserted before the next check, so in-batch
+        duplicates are still caught (by Qdrant instead of in-process).
+        """
+        results = []
+        for (item, fingerprint), embedding in zip(items, embeddings):
+            result = self.check_duplicate(user_id, item, fingerprint, embedding)
+            if not result.is_duplicate:
+                self.add_item(user_id, item, fingerprint, embedding)
+            results.append(result)
+        return results
+
     def find_cross_source_duplicates(
         self, user_id: str, items: List[BriefItem]
     ) -> Dict[str, List[BriefItem]]:
@@ -319,6 +571,12 @@ class SemanticDeduplicator:
         clusters: Dict[str, List[BriefItem]] = {}
         processed = set()
 
+        # Embed every item once; with normalized rows the pairwise
+        # cosine similarities are a single matrix product
+        texts = [self._generate_search_text(item) for item in items]
+        embeddings = self.embedding_service.embed_matrix(texts, normalize=True)
+        similarities = embeddings @ embeddings.T
+
         for i, item in enumerate(items):
             if i in processed:
                 continue
@@ -327,23 +585,14 @@ class SemanticDeduplicator:
             cluster = [item]
             processed.add(i)
 
-            for j, other_item in enumerate(items[i + 1 :], start=i + 1):
-                if j in processed:
-                    continue
-
-                # Calculate similarity
-                text1 = self._generate_search_text(item)
-                text2 = self._generate_search_text(other_item)
+            if not texts[i]:
+                continue
 
-                if not text1 or not text2:
+            for j, other_item in enumerate(items[i + 1 :], start=i + 1):
+                if j in processed or not texts[j]:
                     continue
 
-                emb1 = self.embedding_service.embed_text(text1)
-                emb2 = self.embedding_service.embed_text(text2)
-
-                similarity = self.embedding_service.cosine_similarity(emb1, emb2)
-
-                if similarity >= self.similarity_threshold:
+                if similarities[i, j] >= self.similarity_threshold:
                     cluster.append(other_item)
                     processed.add(j)
 
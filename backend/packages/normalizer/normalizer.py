@@ -2,10 +2,13 @@
 Data Normalization Pipeline
 Converts connector results into BriefItem format
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 from datetime import datetime, timezone
+from functools import partial
+from operator import itemgetter
 import hashlib
 import logging
+import re
 
 from packages.shared.schemas import (
     BriefItem,
@@ -15,10 +18,48 @@ from packages.shared.schemas import (
     Evidence,
     SuggestedAction,
 )
+from packages.shared.timeutils import parse_iso_timestamp
 from packages.connectors.base import ConnectorResult
 
 logger = logging.getLogger(__name__)
 
+# Addresses inside header values such as "Jane Doe <jane@example.com>, bob@example.com"
+_EMAIL_ADDRESS_RE = re.compile(r'[\w.+-]+@[\w-]+(?:\.[\w-]+)+', re.ASCII)
+
+# Required connector fields. Normalizers fetch them with one itemgetter call;
+# normalize_connector_result drops items missing any of them up front.
+_GMAIL_FIELDS = ('source_id', 'timestamp_utc')
+_CALENDAR_FIELDS = ('source_id', 'title', 'start_time', 'timestamp_utc')
+_TITLED_ITEM_FIELDS = ('source_id', 'title', 'timestamp_utc')
+_SOCIAL_FIELDS = frozenset({'id'})
+
+_GMAIL_REQUIRED = itemgetter(*_GMAIL_FIELDS)
+_CALENDAR_REQUIRED = itemgetter(*_CALENDAR_FIELDS)
+_TITLED_ITEM_REQUIRED = itemgetter(*_TITLED_ITEM_FIELDS)
+
+# Engagement metrics shown in social post summaries, in display order
+_TWITTER_METRICS = ('likes', 'retweets', 'replies')
+_SOCIAL_METRIC_FIELDS = {
+    'twitter': _TWITTER_METRICS,
+    'x': _TWITTER_METRICS,
+    'linkedin': ('reactions', 'comments', 'shares'),
+}
+
+
+def _truncate_single_line(text: str, limit: int, suffix: str = "...") -> str:
+    """
+    Return the first line of text, clipped to at most limit characters.
+
+    Finds the line break and the cut point in one scan so only the final
+    slice is allocated. The suffix is counted against the limit.
+    """
+    newline = text.find('\n', 0, limit + 1)
+    if newline != -1:
+        return text[:newline]
+    if len(text) <= limit:
+        return text
+    return text[:limit - len(suffix)] + suffix
+
 
 class Normalizer:
     """
@@ -58,10 +99,11 @@ class Normalizer:
         
         # Extract based on source type
         if source == "gmail":
-            # Extract from sender
+            # Extract from sender ("Jane Doe <jane@x.com>" -> "jane@x.com")
             from_addr = item_data.get('from', '')
             if from_addr:
-                entities.append(Entity(kind="person", key=from_addr))
+                match = _EMAIL_ADDRESS_RE.search(from_addr)
+                entities.append(Entity(kind="person", key=match.group() if match else from_addr))
             
             # TODO: Extract topics from subject/body using NLP
             
@@ -178,7 +220,7 @@ class Normalizer:
         """Normalize Gmail item to BriefItem"""
         source = "gmail"
         type = "email"
-        source_id = item_data['source_id']
+        source_id, timestamp_utc = _GMAIL_REQUIRED(item_data)
         
         # Generate stable ID
         item_ref = Normalizer.generate_stable_id(source, type, source_id)
@@ -195,7 +237,7 @@ class Normalizer:
             item_ref=item_ref,
             source=source,
             type=type,
-            timestamp_utc=item_data['timestamp_utc'],
+            timestamp_utc=timestamp_utc,
             source_id=source_id,
             url=item_data.get('url'),
             title=title,
@@ -213,13 +255,13 @@ class Normalizer:
         """Normalize Calendar item to BriefItem"""
         source = "calendar"
         type = "event"
-        source_id = item_data['source_id']
+        source_id, title, start_time, timestamp_utc = _CALENDAR_REQUIRED(item_data)
         
         # Generate stable ID
         item_ref = Normalizer.generate_stable_id(source, type, source_id)
         
         # Create summary
-        start_time = datetime.fromisoformat(item_data['start_time'].replace('Z', '+00:00'))
+        start_time = parse_iso_timestamp(start_time)
         time_str = start_time.strftime("%I:%M %p")
         location = item_data.get('location', '')
         summary = f"Starts at {time_str}"
@@ -232,10 +274,10 @@ class Normalizer:
             item_ref=item_ref,
             source=source,
             type=type,
-            timestamp_utc=item_data['timestamp_utc'],
+            timestamp_utc=timestamp_utc,
             source_id=source_id,
             url=item_data.get('url'),
-            title=item_data['title'],
+            title=title,
             summary=summary,
             why_it_matters="Upcoming event (importance scoring pending)",
             entities=Normalizer.extract_entities(item_data, source),
@@ -250,7 +292,7 @@ class Normalizer:
         """Normalize Task item to BriefItem"""
         source = "tasks"
         type = "task"
-        source_id = item_data['source_id']
+        source_id, title, timestamp_utc = _TITLED_ITEM_REQUIRED(item_data)
         
         # Generate stable ID
         item_ref = Normalizer.generate_stable_id(source, type, source_id)
@@ -268,10 +310,10 @@ class Normalizer:
             item_ref=item_ref,
             source=source,
             type=type,
-            timestamp_utc=item_data['timestamp_utc'],
+            timestamp_utc=timestamp_utc,
             source_id=source_id,
             url=item_data.get('url'),
-            title=item_data['title'],
+            title=title,
             summary=summary,
             why_it_matters="Pending task (importance scoring pending)",
             entities=Normalizer.extract_entities(item_data, source),
@@ -286,7 +328,7 @@ class Normalizer:
         """Normalize Google Keep note to BriefItem"""
         source = "keep"
         type = "note"
-        source_id = item_data['source_id']
+        source_id, title, timestamp_utc = _TITLED_ITEM_REQUIRED(item_data)
 
         # Generate stable ID
         item_ref = Normalizer.generate_stable_id(source, type, source_id)
@@ -321,10 +363,10 @@ class Normalizer:
             item_ref=item_ref,
             source=source,
             type=type,
-            timestamp_utc=item_data['timestamp_utc'],
+            timestamp_utc=timestamp_utc,
             source_id=source_id,
             url=item_data.get('url'),
-            title=item_data['title'],
+            title=title,
             summary=summary,
             why_it_matters="Personal note/reminder (importance scoring pending)",
             entities=Normalizer.extract_entities(item_data, source),
@@ -335,7 +377,11 @@ class Normalizer:
         )
 
     @staticmethod
-    def normalize_social_post(item_data: Dict[str, Any], source: str) -> BriefItem:
+    def normalize_social_post(
+        item_data: Dict[str, Any],
+        source: str,
+        default_timestamp: Optional[datetime] = None,
+    ) -> BriefItem:
         """
         Normalize social media post to BriefItem.
         
@@ -350,6 +396,8 @@ class Normalizer:
                 - url: Post URL (optional)
                 - metrics: Engagement metrics dict (optional)
             source: Source platform (twitter, x, linkedin, etc.)
+            default_timestamp: Timestamp for posts without one, e.g. the
+                connector fetch time (defaults to now)
         
         Returns:
             Normalized BriefItem
@@ -362,46 +410,26 @@ class Normalizer:
         
         # Format title (first line or truncated content)
         content = item_data.get('content', '')
-        title_lines = content.split('\n')
-        title = title_lines[0] if title_lines else content
-        if len(title) > 80:
-            title = title[:77] + "..."
+        title = _truncate_single_line(content, 80)
         
         # Add author to title
         author = item_data.get('author', 'Unknown')
         title = f"{author}: {title}"
         
         # Create summary with engagement metrics
-        metrics = item_data.get('metrics', {})
-        summary_parts = []
-        
-        if source in ['twitter', 'x']:
-            # Twitter metrics
-            if metrics.get('likes', 0) > 0:
-                summary_parts.append(f"{metrics['likes']} likes")
-            if metrics.get('retweets', 0) > 0:
-                summary_parts.append(f"{metrics['retweets']} retweets")
-            if metrics.get('replies', 0) > 0:
-                summary_parts.append(f"{metrics['replies']} replies")
-        elif source == 'linkedin':
-            # LinkedIn metrics
-            if metrics.get('reactions', 0) > 0:
-                summary_parts.append(f"{metrics['reactions']} reactions")
-            if metrics.get('comments', 0) > 0:
-                summary_parts.append(f"{metrics['comments']} comments")
-            if metrics.get('shares', 0) > 0:
-                summary_parts.append(f"{metrics['shares']} shares")
-        
-        summary = " | ".join(summary_parts) if summary_parts else "No engagement yet"
-        
-        # Add content preview to summary
-        if len(content) > 200:
-            summary = f"{content[:200]}... | {summary}"
-        else:
-            summary = f"{content} | {summary}"
+        metrics = item_data.get('metrics') or {}
+        summary_parts = [
+            f"{metrics[name]} {name}"
+            for name in _SOCIAL_METRIC_FIELDS.get(source, ())
+            if metrics.get(name, 0) > 0
+        ]
+        
+        # Content preview followed by metrics, joined once
+        preview = content if len(content) <= 200 else content[:200] + "..."
+        summary = " | ".join([preview, *(summary_parts or ["No engagement yet"])])
         
         # Extract timestamp
-        timestamp_utc = item_data.get('timestamp')
+        timestamp_utc = item_data.get('timestamp') or default_timestamp
         if timestamp_utc and isinstance(timestamp_utc, str):
             # Already ISO format
             pass
@@ -452,6 +480,45 @@ class Normalizer:
         )
 
 
+# Per-item normalizer and required fields for each connector source
+_ITEM_NORMALIZERS = {
+    "gmail": ("normalize_gmail_item", frozenset(_GMAIL_FIELDS)),
+    "calendar": ("normalize_calendar_item", frozenset(_CALENDAR_FIELDS)),
+    "tasks": ("normalize_task_item", frozenset(_TITLED_ITEM_FIELDS)),
+    "keep": ("normalize_keep_item", frozenset(_TITLED_ITEM_FIELDS)),
+}
+_SOCIAL_SOURCES = frozenset({"twitter", "x", "linkedin"})
+
+
+def _with_required_fields(
+    items: List[Dict[str, Any]],
+    required: frozenset,
+    source: str,
+) -> List[Dict[str, Any]]:
+    """Drop items missing required fields without raising per item."""
+    valid = [item_data for item_data in items if required.issubset(item_data)]
+    skipped = len(items) - len(valid)
+    if skipped:
+        logger.warning(
+            "Skipping %d %s item(s) missing required fields (%s)",
+            skipped, source, ", ".join(sorted(required)),
+        )
+    return valid
+
+
+def _try_normalize(
+    normalize: Callable[[Dict[str, Any]], BriefItem],
+    item_data: Dict[str, Any],
+    source: str,
+) -> Optional[BriefItem]:
+    """Normalize one item, logging and returning None on failure."""
+    try:
+        return normalize(item_data)
+    except Exception as e:
+        logger.error("Error normalizing item from %s: %s", source, e, exc_info=True)
+        return None
+
+
 def normalize_connector_result(result: ConnectorResult) -> List[BriefItem]:
     """
     Normalize a ConnectorResult into a list of BriefItems.
@@ -462,30 +529,27 @@ def normalize_connector_result(result: ConnectorResult) -> List[BriefItem]:
     Returns:
         List of normalized BriefItems
     """
-    brief_items = []
-
-    for item_data in result.items:
-        try:
-            if result.source == "gmail":
-                brief_item = Normalizer.normalize_gmail_item(item_data)
-            elif result.source == "calendar":
-                brief_item = Normalizer.normalize_calendar_item(item_data)
-            elif result.source == "tasks":
-                brief_item = Normalizer.normalize_task_item(item_data)
-            elif result.source == "keep":
-                brief_item = Normalizer.normalize_keep_item(item_data)
-            elif result.source in ["twitter", "x", "linkedin"]:
-                brief_item = Normalizer.normalize_social_post(item_data, result.source)
-            else:
-                logger.warning(f"Unknown source: {result.source}")
-                continue
-
-            brief_items.append(brief_item)
-        except Exception as e:
-            logger.error(f"Error normalizing item from {result.source}: {e}", exc_info=True)
-            continue
-
-    return brief_items
+    if not result.items:
+        return []
+
+    source = result.source
+    if source in _ITEM_NORMALIZERS:
+        method_name, required = _ITEM_NORMALIZERS[source]
+        normalize = getattr(Normalizer, method_name)
+    elif source in _SOCIAL_SOURCES:
+        required = _SOCIAL_FIELDS
+        normalize = partial(
+            Normalizer.normalize_social_post,
+            source=source,
+            default_timestamp=result.fetched_at,
+        )
+    else:
+        logger.warning("Unknown source: %s", source)
+        return []
+
+    items = _with_required_fields(result.items, required, source)
+    brief_items = [_try_normalize(normalize, item_data, source) for item_data in items]
+    return [item for item in brief_items if item is not None]
 
 
 def normalize_social_posts(posts: List[Dict[str, Any]], source: str) -> List[BriefItem]:
@@ -499,14 +563,10 @@ def normalize_social_posts(posts: List[Dict[str, Any]], source: str) -> List[Bri
     Returns:
         List of normalized BriefItems
     """
-    brief_items = []
-
-    for post in posts:
-        try:
-            brief_item = Normalizer.normalize_social_post(post, source)
-            brief_items.append(brief_item)
-        except Exception as e:
-            logger.error(f"Error normalizing social post from {source}: {e}", exc_info=True)
-            continue
+    if not posts:
+        return []
 
-    return brief_items
+    posts = _with_required_fields(posts, _SOCIAL_FIELDS, source)
+    normalize = partial(Normalizer.normalize_social_post, source=source)
+    brief_items = [_try_normalize(normalize, post, source) for post in posts]
+    return [item for item in brief_items if item is not None]
@@ -177,7 +177,7 @@ class BriefOrchestrator:
                 connector = GmailConnector()
                 if connector.is_available():
                     tasks.append(connector.fetch(since=since))
-                module_names.append("gmail")
+                    module_names.append("gmail")
                 else:
                     self.warnings.append("Gmail module not available - Google credentials not configured")
                 
@@ -186,7 +186,7 @@ class BriefOrchestrator:
                 connector = CalendarConnector()
                 if connector.is_available():
                     tasks.append(connector.fetch(since=since))
-                module_names.append("calendar")
+                    module_names.append("calendar")
                 else:
                     self.warnings.append("Calendar module not available - Google credentials not configured")
                 
@@ -195,7 +195,7 @@ class BriefOrchestrator:
                 connector = TasksConnector()
                 if connector.is_available():
                     tasks.append(connector.fetch(since=since))
-                module_names.append("tasks")
+                    module_names.append("tasks")
                 else:
                     self.warnings.append("Tasks module not available - Google credentials not configured")
 
@@ -361,7 +361,7 @@ class BriefOrchestrator:
                     # Research items are already BriefItem objects
                     for item in data:
                         if isinstance(item, BriefItem):
-                        all_items.append(item)
+                            all_items.append(item)
                         
             except Exception as e:
                 self.errors.append(f"Normalization error in {source}: {e}")
@@ -87,8 +87,8 @@ class ActiveLearningIntegrator:
             return items
 
         # Get predictions for all items
-        for item in items:
-            prediction = self.predictive_model.predict_importance(item)
+        predictions = self.predictive_model.predict_importance_batch(items)
+        for item, prediction in zip(items, predictions):
 
             # Store prediction for later use
             item.prediction = prediction
@@ -175,16 +175,15 @@ class ActiveLearningIntegrator:
         if not self.config.enabled:
             return
 
-        learning_feedback_count = 0
+        # Check events against this session's learning items in one pass
+        learning_refs = {li.item.item_ref for li in self.current_session_learning_items}
 
-        for event in feedback_events:
-            # Check if this was a learning item
-            item_ref = event.get('item_id')
-            if self._was_learning_item(item_ref):
-                # Incorporate into model
-                # Note: In real implementation, would need item data here
-                # For now, just count
-                learning_feedback_count += 1
+        # Incorporate into model
+        # Note: In real implementation, would need item data here
+        # For now, just count
+        learning_feedback_count = sum(
+            1 for event in feedback_events if event.get('item_id') in learning_refs
+        )
 
         if learning_feedback_count > 0:
             print(f"Incorporated {learning_feedback_count} learning samples for user {self.user_id}")
@@ -3,9 +3,23 @@ Feature extraction for importance ranking
 """
 from typing import Dict, Any, List, Set, Optional
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 import re
 
 from packages.shared.schemas import BriefItem
+from packages.shared.timeutils import parse_iso_timestamp
+
+
+@lru_cache(maxsize=8192)
+def _lower_text(title: str, summary: str) -> str:
+    """Lowercased "title summary" text, shared by the keyword-matching extractors"""
+    return (title + " " + summary).lower()
+
+
+_ACTION_KEYWORDS = (
+    "please", "need", "required", "urgent", "asap",
+    "action", "respond", "reply", "review", "approve",
+)
 
 
 class FeatureExtractor:
@@ -39,9 +53,9 @@ class FeatureExtractor:
         score = 0.0
         
         # Check topic matches in title and summary
-        text = (item.title + " " + item.summary).lower()
-        topic_matches = sum(1 for topic in self.topics if topic in text)
         if self.topics:
+            text = _lower_text(item.title, item.summary)
+            topic_matches = sum(1 for topic in self.topics if topic in text)
             score += min(topic_matches / len(self.topics), 0.5)
         else:
             score += 0.3  # Default relevance if no topics configured
@@ -68,7 +82,7 @@ class FeatureExtractor:
             Score 0.0-1.0 (higher = more urgent)
         """
         now = datetime.now(timezone.utc)
-        item_time = datetime.fromisoformat(item.timestamp_utc.replace('Z', '+00:00'))
+        item_time = parse_iso_timestamp(item.timestamp_utc)
         
         # Email urgency
         if item.type == "email":
@@ -216,12 +230,8 @@ class FeatureExtractor:
             base_score += 0.2
         
         # Check for action-oriented keywords
-        text = (item.title + " " + item.summary).lower()
-        action_keywords = [
-            "please", "need", "required", "urgent", "asap",
-            "action", "respond", "reply", "review", "approve"
-        ]
-        keyword_matches = sum(1 for kw in action_keywords if kw in text)
+        text = _lower_text(item.title, item.summary)
+        keyword_matches = sum(1 for kw in _ACTION_KEYWORDS if kw in text)
         if keyword_matches > 0:
             base_score += min(keyword_matches * 0.1, 0.3)
         
@@ -14,25 +14,42 @@ Architecture:
 """
 
 import os
-import pickle
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Any
+from dataclasses import dataclass, replace
 
+import joblib
 import numpy as np
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.preprocessing import StandardScaler
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import mean_squared_error, r2_score
 
 from packages.shared.schemas import BriefItem
 from packages.database.models import FeedbackEvent
+from packages.shared.timeutils import parse_iso_timestamp
 from packages.ranking.features import FeatureExtractor
+from packages.ranking.ranker import RankingWeights
 
+# sklearn is imported lazily in train_model (it is ~1s of import time); loading
+# a saved model imports the classes it needs when joblib unpickles them.
+if TYPE_CHECKING:
+    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.preprocessing import StandardScaler
 
-@dataclass
+# Ranking formula used for rule-based predictions before a model is trained
+_RULE_WEIGHTS = RankingWeights()
+
+# Importance score per feedback event type (0.0 dismissed → 1.0 saved)
+_EVENT_SCORES = {
+    'open': 0.6,          # Just opened/clicked
+    'save': 0.9,          # Explicitly saved
+    'dismiss': 0.1,       # Dismissed
+    'thumb_up': 0.8,      # Positive feedback
+    'thumb_down': 0.2,    # Negative feedback
+    'less_like_this': 0.1, # Don't want this type
+}
+
+
+@dataclass(slots=True)
 class PredictionResult:
-    """Result of importance prediction"""
+    """Result of importance prediction (slotted: one is created per ranked item)"""
 
     predicted_score: float  # 0.0-1.0
     confidence: float  # 0.0-1.0 (higher = more confident)
@@ -40,14 +57,83 @@ class PredictionResult:
     feature_importance: Dict[str, float]  # Which features influenced the prediction
 
 
-@dataclass
 class TrainingData:
-    """Training data for the model"""
+    """
+    Training data for the model
+
+    Samples are stored in float32 arrays that grow geometrically up to
+    max_samples; after that the oldest samples are overwritten (ring
+    buffer), so memory stays bounded at max_samples * n_features * 4 bytes.
+    """
 
-    features: np.ndarray
-    labels: np.ndarray  # Actual importance scores (0.0-1.0)
-    item_ids: List[str]
-    timestamps: List[datetime]
+    def __init__(self, n_features: int = 12, max_samples: int = 10_000):
+        self.max_samples = max_samples
+        self._features = np.empty((0, n_features), dtype=np.float32)
+        self._labels = np.empty(0, dtype=np.float32)
+        self.item_ids: List[str] = []
+        self.timestamps: List[datetime] = []
+        self.size = 0
+        self.head = 0  # Next slot to write
+
+    @property
+    def features(self) -> np.ndarray:
+        """Feature rows of the stored samples (a view, no copy)"""
+        return self._features[:self.size]
+
+    @property
+    def labels(self) -> np.ndarray:
+        """Actual importance scores (0.0-1.0) of the stored samples"""
+        return self._labels[:self.size]
+
+    def add(self, features: np.ndarray, label: float, item_id: str, timestamp: datetime):
+        """Store a sample, overwriting the oldest one when full"""
+        # Arrays may be read-only memory maps from _load_model
+        if not self._features.flags.writeable:
+            self._features = self._features.copy()
+        if not self._labels.flags.writeable:
+            self._labels = self._labels.copy()
+
+        if self.size < self.max_samples:
+            if self.size == len(self._labels):
+                self._grow()
+            slot = self.size
+            self.size += 1
+            self.item_ids.append(item_id)
+            self.timestamps.append(timestamp)
+        else:
+            slot = self.head
+            self.item_ids[slot] = item_id
+            self.timestamps[slot] = timestamp
+
+        self._features[slot] = features
+        self._labels[slot] = label
+        self.head = (slot + 1) % self.max_samples
+
+    def _grow(self):
+        """Double capacity (at least 64 rows, at most max_samples)"""
+        capacity = min(self.max_samples, max(64, 2 * len(self._labels)))
+        features = np.empty((capacity, self._features.shape[1]), dtype=np.float32)
+        labels = np.empty(capacity, dtype=np.float32)
+        features[:self.size] = self._features[:self.size]
+        labels[:self.size] = self._labels[:self.size]
+        self._features, self._labels = features, labels
+
+    @classmethod
+    def from_arrays(
+        cls,
+        features: np.ndarray,
+        labels: np.ndarray,
+        item_ids: List[str],
+        timestamps: List[datetime],
+        max_samples: int = 10_000,
+    ) -> "TrainingData":
+        """Build from plain arrays (models saved before the ring buffer)"""
+        features = np.asarray(features, dtype=np.float32)
+        n_features = features.shape[1] if features.ndim == 2 else 12
+        data = cls(n_features=n_features, max_samples=max_samples)
+        for row, label, item_id, timestamp in zip(features, labels, item_ids, timestamps):
+            data.add(row, label, item_id, timestamp)
+        return data
 
 
 class PredictiveImportanceModel:
@@ -67,12 +153,21 @@ class PredictiveImportanceModel:
     - Explicit preferences (VIP lists, topic weights)
     """
 
+    FEATURE_NAMES = (
+        'relevance', 'urgency', 'credibility', 'impact', 'actionability',
+        'topic_match', 'vip_mention', 'source_trust', 'temporal_urgency',
+        'engagement_rate', 'content_length', 'entity_count',
+    )
+
     def __init__(
         self,
         user_id: str,
         model_path: Optional[str] = None,
         min_training_samples: int = 50,
         retrain_threshold: int = 100,  # Retrain every N new samples
+        n_estimators: int = 100,
+        max_depth: int = 10,
+        max_training_samples: int = 10_000,
     ):
         """
         Initialize predictive model
@@ -82,22 +177,25 @@ class PredictiveImportanceModel:
             model_path: Optional path to save/load model
             min_training_samples: Minimum samples needed before training
             retrain_threshold: Retrain when this many new samples accumulate
+            n_estimators: Number of trees in the random forest
+            max_depth: Maximum depth of each tree
+            max_training_samples: Keep at most this many (most recent) samples
         """
         self.user_id = user_id
         self.model_path = model_path or f"models/predictive_{user_id}.pkl"
         self.min_training_samples = min_training_samples
         self.retrain_threshold = retrain_threshold
+        self.n_estimators = n_estimators
+        self.max_depth = max_depth
 
         # ML components
-        self.model: Optional[RandomForestRegressor] = None
-        self.scaler: Optional[StandardScaler] = None
+        self.model: Optional["RandomForestRegressor"] = None
+        self.scaler: Optional["StandardScaler"] = None
 
         # Training data tracking
         self.training_data = TrainingData(
-            features=np.array([]),
-            labels=np.array([]),
-            item_ids=[],
-            timestamps=[]
+            n_features=len(self.FEATURE_NAMES),
+            max_samples=max_training_samples,
         )
         self.new_samples_since_train = 0
 
@@ -117,51 +215,81 @@ class PredictiveImportanceModel:
         Returns:
             PredictionResult with score, confidence, and uncertainty
         """
+        return self.predict_importance_batch([item])[0]
+
+    def predict_importance_batch(self, items: List[BriefItem]) -> List[PredictionResult]:
+        """
+        Predict importance scores for many items at once
+
+        Features are stacked into one matrix, so the scaler and every tree
+        in the forest run once per batch instead of once per item.
+
+        Args:
+            items: Items to predict for
+
+        Returns:
+            PredictionResults in the same order as items
+        """
         if self.model is None or len(self.training_data.labels) < self.min_training_samples:
             # Not enough data - fall back to rule-based scoring
-            return self._rule_based_prediction(item)
+            return self._rule_based_prediction_batch(items)
 
-        # Extract features
-        features = self._extract_features_for_prediction(item)
-        if not features:
-            return self._rule_based_prediction(item)
-
-        # Scale features
-        features_scaled = self.scaler.transform([features])
-
-        # Get prediction and uncertainty
-        predictions = []
-        for estimator in self.model.estimators_:
-            pred = estimator.predict(features_scaled)[0]
-            predictions.append(pred)
-
-        # Calculate statistics
-        predicted_score = float(np.mean(predictions))
-        std_dev = float(np.std(predictions))
-
-        # Confidence = 1 / (1 + uncertainty)
-        # Uncertainty based on prediction variance
-        uncertainty = min(1.0, std_dev * 2)  # Scale variance to 0-1
-        confidence = 1.0 - uncertainty
-
-        # Feature importance from the model
-        feature_names = [
-            'relevance', 'urgency', 'credibility', 'impact', 'actionability',
-            'topic_match', 'vip_mention', 'source_trust', 'temporal_urgency',
-            'engagement_rate', 'content_length', 'entity_count'
+        # Extract features once per distinct item; batches often repeat items.
+        # Only memoized within the call, since urgency features depend on now
+        features_by_key: Dict[Tuple[str, str], Optional[np.ndarray]] = {}
+        features = []
+        for item in items:
+            key = (item.item_ref, item.timestamp_utc)
+            if key not in features_by_key:
+                features_by_key[key] = self._extract_features_for_prediction(item)
+            features.append(features_by_key[key])
+
+        valid = [i for i, item_features in enumerate(features) if item_features is not None]
+
+        results: List[Optional[PredictionResult]] = [None] * len(items)
+
+        if valid:
+            # Scale features
+            X = np.stack([features[i] for i in valid]).astype(np.float32, copy=False)
+            features_scaled = self.scaler.transform(X)
+
+            predicted_scores, std_devs = self._compute_uncertainty_batch(features_scaled)
+
+            # Feature importance from the model
+            feature_importance = dict(zip(self.FEATURE_NAMES, self.model.feature_importances_))
+
+            for row, i in enumerate(valid):
+                predicted_score = float(predicted_scores[row])
+
+                # Confidence = 1 / (1 + uncertainty)
+                # Uncertainty based on prediction variance
+                uncertainty = min(1.0, float(std_devs[row]) * 2)  # Scale variance to 0-1
+                confidence = 1.0 - uncertainty
+
+                results[i] = PredictionResult(
+                    predicted_score=max(0.0, min(1.0, predicted_score)),
+                    confidence=max(0.0, min(1.0, confidence)),
+                    uncertainty=uncertainty,
+                    feature_importance=dict(feature_importance),
+                )
+
+        return [
+            result if result is not None else self._rule_based_prediction(item)
+            for item, result in zip(items, results)
         ]
 
-        feature_importance = dict(zip(
-            feature_names,
-            self.model.feature_importances_
-        ))
+    def _compute_uncertainty_batch(self, features_scaled: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Mean and spread of the per-tree predictions for a batch
 
-        return PredictionResult(
-            predicted_score=max(0.0, min(1.0, predicted_score)),
-            confidence=max(0.0, min(1.0, confidence)),
-            uncertainty=uncertainty,
-            feature_importance=feature_importance,
-        )
+        Each tree predicts the whole batch in one call, giving an
+        (n_trees, n_items) array; the forest's prediction is the mean over
+        trees and the standard deviation is the uncertainty.
+        """
+        tree_predictions = np.stack([
+            estimator.predict(features_scaled) for estimator in self.model.estimators_
+        ])
+        return tree_predictions.mean(axis=0), tree_predictions.std(axis=0)
 
     def add_feedback_sample(self, item: BriefItem, feedback: FeedbackEvent):
         """
@@ -173,26 +301,17 @@ class PredictiveImportanceModel:
         """
         # Extract features
         features = self._extract_features_for_training(item)
-        if not features:
+        if features is None:
             return
 
         # Convert feedback to importance score (0.0-1.0)
         importance_score = self._feedback_to_importance_score(feedback)
 
         # Add to training data
-        self.training_data.features = np.vstack([
-            self.training_data.features,
-            features
-        ]) if self.training_data.features.size > 0 else np.array([features])
-
-        self.training_data.labels = np.append(
-            self.training_data.labels,
-            importance_score
+        self.training_data.add(
+            features, importance_score, item.item_ref, feedback.created_at_utc
         )
 
-        self.training_data.item_ids.append(item.item_ref)
-        self.training_data.timestamps.append(feedback.created_at_utc)
-
         self.new_samples_since_train += 1
 
         # Retrain if enough new samples
@@ -213,6 +332,11 @@ class PredictiveImportanceModel:
         if len(self.training_data.labels) < self.min_training_samples and not force:
             return False
 
+        from sklearn.ensemble import RandomForestRegressor
+        from sklearn.preprocessing import StandardScaler
+        from sklearn.model_selection import train_test_split
+        from sklearn.metrics import mean_squared_error, r2_score
+
         # Prepare data
         X = self.training_data.features
         y = self.training_data.labels
@@ -222,15 +346,15 @@ class PredictiveImportanceModel:
             X, y, test_size=0.2, random_state=42
         )
 
-        # Scale features
-        self.scaler = StandardScaler()
+        # Scale features (in place; the split arrays are already copies)
+        self.scaler = StandardScaler(copy=False)
         X_train_scaled = self.scaler.fit_transform(X_train)
         X_test_scaled = self.scaler.transform(X_test)
 
         # Train model
         self.model = RandomForestRegressor(
-            n_estimators=100,
-            max_depth=10,
+            n_estimators=self.n_estimators,
+            max_depth=self.max_depth,
             random_state=42,
             n_jobs=-1
         )
@@ -264,8 +388,7 @@ class PredictiveImportanceModel:
         """
         uncertain_items = []
 
-        for item in items:
-            prediction = self.predict_importance(item)
+        for item, prediction in zip(items, self.predict_importance_batch(items)):
             if prediction.confidence < threshold:
                 # Add prediction info to item for later use
                 item.prediction = prediction
@@ -273,19 +396,23 @@ class PredictiveImportanceModel:
 
         return uncertain_items
 
-    def _extract_features_for_prediction(self, item: BriefItem) -> Optional[List[float]]:
+    def _ranking_components(self, item: BriefItem) -> Tuple[float, float, float, float, float]:
+        """Standard ranking features: relevance, urgency, credibility, impact, actionability"""
+        fe = self.feature_extractor
+        return (
+            fe.extract_relevance(item),
+            fe.extract_urgency(item),
+            fe.extract_credibility(item),
+            fe.extract_impact(item),
+            fe.extract_actionability(item),
+        )
+
+    def _extract_features_for_prediction(self, item: BriefItem) -> Optional[np.ndarray]:
         """Extract features for prediction (same as training but no feedback)"""
         try:
-            # Get standard ranking features
-            ranking_features = self.feature_extractor.extract_all_features(item)
-
-            # Add prediction-specific features
-            features = [
-                ranking_features.relevance,
-                ranking_features.urgency,
-                ranking_features.credibility,
-                ranking_features.impact,
-                ranking_features.actionability,
+            # Standard ranking features, then prediction-specific features
+            features = np.asarray([
+                *self._ranking_components(item),
 
                 # Additional features for ML
                 self._calculate_topic_match(item),
@@ -295,14 +422,14 @@ class PredictiveImportanceModel:
                 self._get_engagement_rate(item),
                 self._get_content_length(item),
                 self._get_entity_count(item),
-            ]
+            ], dtype=np.float32)
 
             return features
 
         except Exception:
             return None
 
-    def _extract_features_for_training(self, item: BriefItem) -> Optional[List[float]]:
+    def _extract_features_for_training(self, item: BriefItem) -> Optional[np.ndarray]:
         """Extract features for training (includes historical patterns)"""
         # Same as prediction features for now
         return self._extract_features_for_prediction(item)
@@ -313,16 +440,7 @@ class PredictiveImportanceModel:
 
         Scale: 0.0 (dismissed) → 1.0 (saved + thumb up)
         """
-        base_scores = {
-            'open': 0.6,          # Just opened/clicked
-            'save': 0.9,          # Explicitly saved
-            'dismiss': 0.1,       # Dismissed
-            'thumb_up': 0.8,      # Positive feedback
-            'thumb_down': 0.2,    # Negative feedback
-            'less_like_this': 0.1, # Don't want this type
-        }
-
-        base_score = base_scores.get(feedback.event_type, 0.5)
+        base_score = _EVENT_SCORES.get(feedback.event_type, 0.5)
 
         # Boost for multiple interactions
         if hasattr(feedback, 'interaction_count'):
@@ -330,20 +448,40 @@ class PredictiveImportanceModel:
 
         return base_score
 
+    def _rule_based_prediction_batch(self, items: List[BriefItem]) -> List[PredictionResult]:
+        """Rule-based predictions, scoring each distinct item in the batch once"""
+        by_key: Dict[Tuple[str, str], PredictionResult] = {}
+        results = []
+        for item in items:
+            key = (item.item_ref, item.timestamp_utc)
+            if key not in by_key:
+                by_key[key] = self._rule_based_prediction(item)
+            cached = by_key[key]
+            results.append(replace(cached, feature_importance=dict(cached.feature_importance)))
+        return results
+
     def _rule_based_prediction(self, item: BriefItem) -> PredictionResult:
         """Fallback rule-based prediction when no ML model available"""
         try:
-            features = self.feature_extractor.extract_all_features(item)
-            score = features.final_score if hasattr(features, 'final_score') else 0.5
+            relevance, urgency, credibility, impact, actionability = self._ranking_components(item)
+            # Default ranking formula (weights sum to 1.0)
+            w = _RULE_WEIGHTS
+            score = (
+                w.relevance * relevance
+                + w.urgency * urgency
+                + w.credibility * credibility
+                + w.impact * impact
+                + w.actionability * actionability
+            )
 
             return PredictionResult(
-                predicted_score=score,
+                predicted_score=max(0.0, min(1.0, score)),
                 confidence=0.3,  # Low confidence (rule-based)
                 uncertainty=0.7,
                 feature_importance={
                     'rule_based': 1.0,
-                    'relevance': getattr(features, 'relevance', 0.0),
-                    'urgency': getattr(features, 'urgency', 0.0),
+                    'relevance': relevance,
+                    'urgency': urgency,
                 }
             )
         except Exception:
@@ -371,7 +509,8 @@ class PredictiveImportanceModel:
     def _calculate_temporal_urgency(self, item: BriefItem) -> float:
         """Calculate urgency based on timing"""
         # Simplified: higher for recent items
-        hours_old = (datetime.now(timezone.utc) - item.timestamp_utc).total_seconds() / 3600
+        item_time = parse_iso_timestamp(item.timestamp_utc)
+        hours_old = (datetime.now(timezone.utc) - item_time).total_seconds() / 3600
         return max(0.0, 1.0 - (hours_old / 24))  # Decay over 24 hours
 
     def _get_engagement_rate(self, item: BriefItem) -> float:
@@ -395,13 +534,17 @@ class PredictiveImportanceModel:
         """Save model to disk"""
         try:
             os.makedirs(os.path.dirname(self.model_path), exist_ok=True)
-            with open(self.model_path, 'wb') as f:
-                pickle.dump({
-                    'model': self.model,
-                    'scaler': self.scaler,
-                    'training_data': self.training_data,
-                    'user_id': self.user_id,
-                }, f)
+            # Uncompressed so arrays can be memory-mapped on load. Write to a
+            # temp file and swap it in: the current file may still be mapped
+            # by a previous load, and truncating it in place raises SIGBUS.
+            tmp_path = f"{self.model_path}.{os.getpid()}.tmp"
+            joblib.dump({
+                'model': self.model,
+                'scaler': self.scaler,
+                'training_data': self.training_data,
+                'user_id': self.user_id,
+            }, tmp_path)
+            os.replace(tmp_path, self.model_path)
         except Exception as e:
             print(f"Failed to save model: {e}")
 
@@ -409,11 +552,23 @@ class PredictiveImportanceModel:
         """Load model from disk"""
         try:
             if os.path.exists(self.model_path):
-                with open(self.model_path, 'rb') as f:
-                    data = pickle.load(f)
-                    self.model = data['model']
-                    self.scaler = data['scaler']
-                    self.training_data = data['training_data']
+                # Large arrays are mapped read-only and paged in on first use;
+                # files written with plain pickle still load
+                data = joblib.load(self.model_path, mmap_mode='r')
+                self.model = data['model']
+                self.scaler = data['scaler']
+                training_data = data['training_data']
+                if '_labels' not in vars(training_data):
+                    # Saved before training data became a ring buffer
+                    legacy = vars(training_data)
+                    training_data = TrainingData.from_arrays(
+                        legacy['features'],
+                        legacy['labels'],
+                        legacy['item_ids'],
+                        legacy['timestamps'],
+                        max_samples=self.training_data.max_samples,
+                    )
+                self.training_data = training_data
         except Exception as e:
             print(f"Failed to load model: {e}")
 
@@ -467,13 +622,24 @@ class ActiveLearningManager:
             items, threshold=self.uncertainty_threshold
         )
 
-        # Sort by uncertainty (highest first)
-        uncertain_items.sort(
-            key=lambda item: getattr(item, 'prediction', PredictionResult(0, 0, 1, {})).uncertainty,
-            reverse=True
+        n = len(uncertain_items)
+        if n == 0 or max_candidates <= 0:
+            return []
+
+        uncertainty = np.fromiter(
+            (
+                item.prediction.uncertainty if hasattr(item, 'prediction') else 1.0
+                for item in uncertain_items
+            ),
+            dtype=np.float32,
+            count=n,
         )
 
-        return uncertain_items[:max_candidates]
+        # Highest uncertainty first; stable so ties (common, uncertainty is
+        # capped at 1.0) keep their input order
+        top = np.argsort(-uncertainty, kind='stable')[:max_candidates]
+
+        return [uncertain_items[i] for i in top]
 
     def incorporate_feedback(self, item: BriefItem, feedback: FeedbackEvent):
         """
@@ -4,6 +4,8 @@ Ranking engine for importance scoring and item selection
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 
+import numpy as np
+
 from packages.shared.schemas import BriefItem, RankingScores
 from .features import FeatureExtractor
 
@@ -29,6 +31,23 @@ class RankingWeights:
         )
 
 
+# Largest float rounding error absorbed when clipping scores to [0, 1]
+_SCORE_TOLERANCE = 1e-9
+
+
+def _clip_rounding(score: float) -> float:
+    """
+    Clip a weighted score that left [0, 1] only through float rounding.
+
+    Ranker.__init__ normalizes the weights, so a larger excursion means the
+    weights were not normalized; it is passed through and fails RankingScores
+    validation instead of saturating at 1.0 and collapsing the order into ties.
+    """
+    if -_SCORE_TOLERANCE <= score <= 1.0 + _SCORE_TOLERANCE:
+        return min(1.0, max(0.0, score))
+    return score
+
+
 @dataclass
 class SelectionCaps:
     """Budget constraints for item selection"""
@@ -79,30 +98,9 @@ class Ranker:
         Returns:
             RankingScores with all component scores and final score
         """
-        # Extract feature scores
-        relevance = self.feature_extractor.extract_relevance(item)
-        urgency = self.feature_extractor.extract_urgency(item)
-        credibility = self.feature_extractor.extract_credibility(item)
-        impact = self.feature_extractor.extract_impact(item)
-        actionability = self.feature_extractor.extract_actionability(item)
-        
-        # Calculate final weighted score
-        final_score = (
-            self.weights.relevance * relevance +
-            self.weights.urgency * urgency +
-            self.weights.credibility * credibility +
-            self.weights.impact * impact +
-            self.weights.actionability * actionability
-        )
-        
-        return RankingScores(
-            relevance_score=relevance,
-            urgency_score=urgency,
-            credibility_score=credibility,
-            impact_score=impact,
-            actionability_score=actionability,
-            final_score=final_score,
-        )
+        scores = self._extract_score_matrix([item])
+        final_scores = scores @ self._weights_vector()
+        return self._to_ranking_scores(scores[0], final_scores[0])
     
     def rank_items(self, items: List[BriefItem]) -> List[BriefItem]:
         """
@@ -114,14 +112,57 @@ class Ranker:
         Returns:
             List of items sorted by final_score (highest first)
         """
-        # Score each item
-        for item in items:
-            item.ranking = self.score_item(item)
+        if not items:
+            return []
+        
+        # Score all items at once: one (N, 5) feature matrix, one weighted sum
+        scores = self._extract_score_matrix(items)
+        final_scores = scores @ self._weights_vector()
+        
+        for item, row, final_score in zip(items, scores, final_scores):
+            item.ranking = self._to_ranking_scores(row, final_score)
         
-        # Sort by final score (descending)
-        ranked = sorted(items, key=lambda x: x.ranking.final_score, reverse=True)
+        # Sort by final score (descending); stable, so ties keep input order
+        order = np.argsort(-final_scores, kind='stable')
         
-        return ranked
+        return [items[i] for i in order]
+    
+    def _extract_score_matrix(self, items: List[BriefItem]) -> np.ndarray:
+        """
+        Extract component scores into an (N, 5) array.
+        
+        Columns: relevance, urgency, credibility, impact, actionability
+        """
+        fe = self.feature_extractor
+        scores = np.empty((len(items), 5), dtype=np.float64)
+        for row, item in zip(scores, items):
+            row[0] = fe.extract_relevance(item)
+            row[1] = fe.extract_urgency(item)
+            row[2] = fe.extract_credibility(item)
+            row[3] = fe.extract_impact(item)
+            row[4] = fe.extract_actionability(item)
+        return scores
+    
+    def _weights_vector(self) -> np.ndarray:
+        """Ranking weights in _extract_score_matrix column order"""
+        w = self.weights
+        return np.array(
+            [w.relevance, w.urgency, w.credibility, w.impact, w.actionability],
+            dtype=np.float64,
+        )
+    
+    @staticmethod
+    def _to_ranking_scores(row: np.ndarray, final_score: float) -> RankingScores:
+        """Build RankingScores from one score matrix row"""
+        relevance, urgency, credibility, impact, actionability = row.tolist()
+        return RankingScores(
+            relevance_score=relevance,
+            urgency_score=urgency,
+            credibility_score=credibility,
+            impact_score=impact,
+            actionability_score=actionability,
+            final_score=_clip_rounding(float(final_score)),
+        )
     
     def select_top_highlights(
         self,
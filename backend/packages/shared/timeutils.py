@@ -0,0 +1,17 @@
+"""
+Timestamp helpers shared by the normalizer, ranking and memory packages.
+"""
+from datetime import datetime
+from functools import lru_cache
+
+
+@lru_cache(maxsize=8192)
+def parse_iso_timestamp(value: str) -> datetime:
+    """
+    Parse an ISO-8601 timestamp, accepting a trailing 'Z' for UTC.
+
+    Connectors emit the same timestamp strings over and over, and each item
+    is parsed again by several ranking extractors and the predictive model.
+    Datetimes are immutable, so results are memoized.
+    """
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+PAL Test Profile Report
+Prints the functions with the highest cumulative time from a cProfile dump
+written by `make profile-tests`.
+"""
+import argparse
+import pstats
+import sys
+from pathlib import Path
+
+DEFAULT_PROFILE = Path(__file__).parent.parent / ".profile" / "test.prof"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Show the slowest functions in a test profile")
+    parser.add_argument("profile", nargs="?", default=str(DEFAULT_PROFILE), help="cProfile output file")
+    parser.add_argument("-n", "--limit", type=int, default=20, help="number of functions to show")
+    parser.add_argument("-s", "--sort", default="cumulative", help="pstats sort key (cumulative, tottime, ncalls)")
+    args = parser.parse_args()
+
+    profile_path = Path(args.profile)
+    if not profile_path.exists():
+        print(f"❌ Profile not found: {profile_path}")
+        print("   Run `make profile-tests` first.")
+        return 1
+
+    stats = pstats.Stats(str(profile_path))
+    stats.strip_dirs().sort_stats(args.sort).print_stats(args.limit)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,7 @@
 """
 Pytest configuration and shared fixtures
 """
+import copy
 import os
 import sys
 from datetime import datetime, timezone
@@ -23,6 +24,28 @@ from packages.shared.schemas import (
 )
 
 
+# ============================================================================
+# Command-line Options
+# ============================================================================
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--skip-slow",
+        action="store_true",
+        default=False,
+        help="skip tests marked slow (full pipeline runs)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if not config.getoption("--skip-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="--skip-slow given")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
 # ============================================================================
 # Database Fixtures
 # ============================================================================
@@ -254,3 +277,37 @@ def sample_brief_items_for_ranking() -> list[BriefItem]:
     ))
 
     return items
+
+
+# ============================================================================
+# Orchestrator Fixtures
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def _orchestrator_template():
+    """Build the orchestrator and its ranker once per session."""
+    from packages.orchestrator.orchestrator import BriefOrchestrator
+
+    return BriefOrchestrator(user_id="user123")
+
+
+@pytest.fixture
+def orchestrator(_orchestrator_template, tmp_path):
+    """
+    Fresh per-test orchestrator sharing the session's components.
+
+    Memory and novelty state are per test, in a temporary directory, so
+    whether an item is NEW or REPEAT never depends on test order, and tests
+    never write to the repository's memory_store/.
+    """
+    from packages.memory import MemoryManager, NoveltyDetector
+
+    orch = copy.copy(_orchestrator_template)
+    orch.memory_manager = MemoryManager(tmp_path / "memory_store")
+    orch.novelty_detector = NoveltyDetector(orch.memory_manager)
+    orch.user_preferences = {}
+    orch.progress_callback = None
+    orch._synthesizer = None
+    orch.warnings = []
+    orch.errors = []
+    return orch
@@ -1,6 +1,8 @@
 """
 Extended tests for fingerprint module - Target 85%+ coverage
 """
+import hashlib
+
 import pytest
 from packages.memory.fingerprint import (
     FingerprintGenerator,
@@ -337,6 +339,10 @@ class TestHashString:
         result2 = _hash_string("test")
         assert result1 == result2
 
+    def test_hash_string_is_stable_sha256_prefix(self):
+        """Test the digest stays a SHA-256 prefix so stored fingerprints keep matching"""
+        assert _hash_string("test") == hashlib.sha256(b"test").hexdigest()[:16]
+
     def test_hash_string_uniqueness(self):
         """Test hash string uniqueness"""
         result1 = _hash_string("input1")
@@ -3,8 +3,14 @@ Comprehensive tests for Normalizer module - Target 90%+ coverage
 """
 import pytest
 from datetime import datetime, timezone
-from packages.normalizer.normalizer import Normalizer, normalize_connector_result, normalize_social_posts
+from packages.normalizer.normalizer import (
+    Normalizer,
+    normalize_connector_result,
+    normalize_social_posts,
+    _truncate_single_line,
+)
 from packages.connectors.base import ConnectorResult
+from packages.shared.timeutils import parse_iso_timestamp
 from packages.shared.schemas import BriefItem
 
 
@@ -49,6 +55,19 @@ class TestNormalizerGmail:
         result = Normalizer.normalize_gmail_item(data)
         assert len(result.summary) <= 200
         
+    def test_normalize_gmail_multiline_snippet(self):
+        """Test Gmail summary is a plain 200-char slice that keeps later lines"""
+        snippet = 'Hi team,\n' + 'B' * 300
+        data = {
+            'source_id': 'msg3',
+            'snippet': snippet,
+            'subject': 'Test',
+            'from': 'test@example.com',
+            'timestamp_utc': '2024-01-15T12:00:00Z'
+        }
+        result = Normalizer.normalize_gmail_item(data)
+        assert result.summary == snippet[:200]
+        
     def test_normalize_gmail_no_subject(self):
         """Test Gmail without subject"""
         data = {
@@ -164,6 +183,18 @@ class TestNormalizerSocial:
         assert '100 likes' in result.summary
         assert '50 retweets' in result.summary
         
+    def test_normalize_linkedin_metrics_order(self):
+        """Test LinkedIn metrics are listed in order and zeros skipped"""
+        data = {
+            'id': 'post5',
+            'author': 'User Name',
+            'content': 'Post',
+            'timestamp': '2024-01-15T12:00:00Z',
+            'metrics': {'shares': 3, 'comments': 0, 'reactions': 7}
+        }
+        result = Normalizer.normalize_social_post(data, 'linkedin')
+        assert result.summary == 'Post | 7 reactions | 3 shares'
+        
     def test_normalize_linkedin_basic(self):
         """Test LinkedIn normalization"""
         data = {
@@ -285,6 +316,20 @@ class TestHelperFunctions:
         assert isinstance(id, str)
         assert len(id) > 0
         
+    def test_truncate_single_line(self):
+        """Test first-line truncation helper"""
+        assert _truncate_single_line('short', 80) == 'short'
+        assert _truncate_single_line('Line 1\nLine 2', 80) == 'Line 1'
+        clipped = _truncate_single_line('A' * 300, 80)
+        assert len(clipped) == 80
+        assert clipped.endswith('...')
+        
+    def test_parse_iso_timestamp_cached(self):
+        """Test ISO parsing accepts 'Z' and reuses parsed values"""
+        parsed = parse_iso_timestamp('2024-01-15T12:00:00Z')
+        assert parsed == datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+        assert parse_iso_timestamp('2024-01-15T12:00:00Z') is parsed
+        
     def test_extract_entities_empty(self):
         """Test entity extraction with empty data"""
         entities = Normalizer.extract_entities({}, 'gmail')
@@ -299,6 +344,20 @@ class TestHelperFunctions:
         entities = Normalizer.extract_entities(data, 'gmail')
         assert isinstance(entities, list)
         
+    def test_extract_entities_gmail_headers(self):
+        """Test the sender address is pulled out of a display-name header; recipients are ignored"""
+        data = {
+            'from': 'Jane Doe <jane@example.com>',
+            'to': 'bob@example.com, me@example.com'
+        }
+        entities = Normalizer.extract_entities(data, 'gmail')
+        assert [e.key for e in entities] == ['jane@example.com']
+
+    def test_extract_entities_gmail_display_only_sender(self):
+        """Test senders without an address keep the raw header"""
+        entities = Normalizer.extract_entities({'from': 'Mailer Daemon'}, 'gmail')
+        assert [e.key for e in entities] == ['Mailer Daemon']
+        
     def test_create_novelty_info(self):
         """Test novelty info creation"""
         info = Normalizer.create_novelty_info()
@@ -397,6 +456,18 @@ class TestConnectorResultNormalization:
         brief_items = normalize_connector_result(result)
         assert len(brief_items) == 2
         
+    def test_normalize_connector_result_social_uses_fetch_time(self):
+        """Test posts without a timestamp fall back to fetched_at"""
+        fetched_at = datetime(2024, 1, 15, 8, 30, tzinfo=timezone.utc)
+        result = ConnectorResult(
+            source='x',
+            status='ok',
+            fetched_at=fetched_at,
+            items=[{'id': 'post1', 'author': 'user1', 'content': 'Post 1'}]
+        )
+        brief_items = normalize_connector_result(result)
+        assert brief_items[0].timestamp_utc == fetched_at.isoformat()
+        
     def test_normalize_connector_result_empty(self):
         """Test normalizing empty result"""
         result = ConnectorResult(
@@ -409,6 +480,17 @@ class TestConnectorResultNormalization:
         brief_items = normalize_connector_result(result)
         assert len(brief_items) == 0
         
+    def test_normalize_connector_result_empty_unknown_source(self):
+        """Test empty result returns before source dispatch"""
+        result = ConnectorResult(
+            source='unknown',
+            status='ok',
+            fetched_at=datetime.now(timezone.utc),
+            items=[]
+        )
+        assert normalize_connector_result(result) == []
+        assert normalize_social_posts([], 'x') == []
+        
     def test_normalize_social_posts_function(self):
         """Test normalize_social_posts convenience function"""
         posts = [
@@ -450,6 +532,21 @@ class TestErrorHandling:
         # Should skip invalid item but process valid one
         assert len(brief_items) >= 0
         
+    def test_normalize_connector_result_skips_missing_fields(self, caplog):
+        """Test items missing required fields are dropped without an error log"""
+        result = ConnectorResult(
+            source='tasks',
+            status='ok',
+            fetched_at=datetime.now(timezone.utc),
+            items=[
+                {'source_id': 'task1', 'timestamp_utc': '2024-01-15T12:00:00Z'},
+                {'source_id': 'task2', 'title': 'Task', 'timestamp_utc': '2024-01-15T12:00:00Z'}
+            ]
+        )
+        brief_items = normalize_connector_result(result)
+        assert [item.source_id for item in brief_items] == ['task2']
+        assert not [r for r in caplog.records if r.levelname == 'ERROR']
+        
     def test_normalize_social_posts_with_error(self):
         """Test social posts with invalid item"""
         posts = [
@@ -8,17 +8,25 @@ Tests:
 4. Enhanced novelty detection (V2)
 """
 
+import hashlib
 import os
+import numpy as np
 import pytest
 from datetime import datetime, timezone, timedelta
 from unittest.mock import Mock, patch, MagicMock
 
 from packages.memory.embeddings import (
     EmbeddingService,
+    Model2VecProvider,
     OpenAIEmbeddingProvider,
     SentenceTransformerProvider,
 )
-from packages.memory.semantic_dedup import SemanticDeduplicator, SimilarItem
+from packages.memory.semantic_dedup import (
+    SemanticDeduplicator,
+    SemanticDuplicateResult,
+    SimilarItem,
+    _epoch_ns,
+)
 from packages.memory.entity_tracking import EntityTracker, EntityUpdate
 from packages.memory.novelty_v2 import (
     EnhancedNoveltyDetector,
@@ -26,6 +34,13 @@ from packages.memory.novelty_v2 import (
     detect_novelty_enhanced,
 )
 from packages.shared.schemas import BriefItem, Entity, NoveltyInfo, RankingScores
+from qdrant_client import models as qdrant_models
+
+# search_batch/SearchRequest were removed in newer qdrant-client releases
+requires_search_batch = pytest.mark.skipif(
+    not hasattr(qdrant_models, "SearchRequest"),
+    reason="requires the pinned qdrant-client search_batch API",
+)
 
 
 # ============================================================================
@@ -33,6 +48,28 @@ from packages.shared.schemas import BriefItem, Entity, NoveltyInfo, RankingScore
 # ============================================================================
 
 
+def make_brief_item(item_ref, title, source="news", timestamp_utc="2024-01-15T10:00:00Z"):
+    """Minimal valid BriefItem (timestamp_utc is an ISO string, as in production)"""
+    return BriefItem(
+        item_ref=item_ref,
+        source=source,
+        type="article",
+        timestamp_utc=timestamp_utc,
+        title=title,
+        summary="",
+        why_it_matters="",
+        novelty=NoveltyInfo(label="NEW", reason="First time", first_seen_utc=timestamp_utc),
+        ranking=RankingScores(
+            relevance_score=0.5,
+            urgency_score=0.5,
+            credibility_score=0.5,
+            impact_score=0.5,
+            actionability_score=0.5,
+            final_score=0.5,
+        ),
+    )
+
+
 @pytest.fixture
 def mock_embedding_provider():
     """Mock embedding provider for testing"""
@@ -188,6 +225,39 @@ class TestEmbeddingService:
         # Empty text should have zero vector
         assert all(x == 0.0 for x in embeddings[1])
 
+    def test_embed_batch_single_provider_call(self, embedding_service, mock_embedding_provider):
+        """Test batch embedding sends only non-empty texts, in one call"""
+        embeddings = embedding_service.embed_batch(["Text 1", "", "Text 2"])
+
+        mock_embedding_provider.embed_batch.assert_called_once_with(["Text 1", "Text 2"])
+        mock_embedding_provider.embed_text.assert_not_called()
+        assert embeddings[0] == pytest.approx([0.1] * 384)
+        assert embeddings[2] == pytest.approx([0.2] * 384)
+
+    def test_embed_text_cached(self, embedding_service, mock_embedding_provider):
+        """Test repeated text is served from the embedding cache"""
+        first = embedding_service.embed_text("Repeated text")
+        second = embedding_service.embed_text("Repeated text")
+
+        assert first == second
+        mock_embedding_provider.embed_text.assert_called_once()
+
+    def test_embed_batch_embeds_each_miss_once(self, embedding_service, mock_embedding_provider):
+        """Test batch embedding skips cached and repeated texts"""
+        embedding_service.embed_text("Cached")
+        embedding_service.embed_batch(["Cached", "New", "New"])
+
+        mock_embedding_provider.embed_batch.assert_called_once_with(["New"])
+
+    def test_embedding_cache_evicts_least_recent(self, mock_embedding_provider):
+        """Test the embedding cache is bounded by cache_size"""
+        service = EmbeddingService(provider=mock_embedding_provider, cache_size=1)
+        service.embed_text("First")
+        service.embed_text("Second")
+        service.embed_text("First")
+
+        assert mock_embedding_provider.embed_text.call_count == 3
+
     def test_cosine_similarity(self, embedding_service):
         """Test cosine similarity calculation"""
         vec1 = [1.0, 0.0, 0.0]
@@ -204,6 +274,33 @@ class TestEmbeddingService:
         similarity = embedding_service.cosine_similarity(vec1, vec2)
         assert similarity == pytest.approx(0.0, abs=1e-6)
 
+    def test_cosine_similarity_zero_vector(self, embedding_service):
+        """Test cosine similarity with an empty-text (zero) embedding"""
+        similarity = embedding_service.cosine_similarity([0.0, 0.0], [1.0, 0.0])
+        assert similarity == 0.0
+
+    def test_embed_matrix(self, embedding_service):
+        """Test batch embedding as a normalized float32 matrix"""
+        matrix = embedding_service.embed_matrix(["First text", "Second text"], normalize=True)
+
+        assert matrix.shape == (2, 384)
+        assert matrix.dtype == np.float32
+        assert np.linalg.norm(matrix, axis=1) == pytest.approx([1.0, 1.0], rel=1e-5)
+
+    def test_embed_matrix_empty_text_zero_row(self, embedding_service, mock_embedding_provider):
+        """Test empty texts stay zero rows after normalization"""
+        mock_embedding_provider.embed_batch.return_value = [[0.1] * 384]
+        matrix = embedding_service.embed_matrix(["Text", ""], normalize=True)
+
+        assert not matrix[1].any()
+
+    def test_cosine_similarity_batch(self, embedding_service):
+        """Test cosine similarity against every row of a matrix"""
+        matrix = np.array([[1.0, 0.0], [0.0, 1.0], [0.0, 0.0]], dtype=np.float32)
+
+        similarities = embedding_service.cosine_similarity_batch([1.0, 0.0], matrix)
+        assert similarities.tolist() == pytest.approx([1.0, 0.0, 0.0])
+
     def test_get_dimension(self, embedding_service):
         """Test get embedding dimension"""
         assert embedding_service.get_dimension() == 384
@@ -212,6 +309,8 @@ class TestEmbeddingService:
 class TestSentenceTransformerProvider:
     """Test sentence transformer provider (local embeddings)"""
 
+    @pytest.mark.slow
+    @pytest.mark.integration
     @pytest.mark.skipif(
         os.getenv("SKIP_SLOW_TESTS") == "1", reason="Slow test - downloads model"
     )
@@ -225,6 +324,8 @@ class TestSentenceTransformerProvider:
         assert len(embedding) == 384  # MiniLM dimension
         assert all(isinstance(x, float) for x in embedding)
 
+    @pytest.mark.slow
+    @pytest.mark.integration
     @pytest.mark.skipif(
         os.getenv("SKIP_SLOW_TESTS") == "1", reason="Slow test - downloads model"
     )
@@ -238,6 +339,60 @@ class TestSentenceTransformerProvider:
         assert len(embeddings) == 3
         assert all(len(emb) == 384 for emb in embeddings)
 
+    def test_sentence_transformer_quantized_uses_onnx(self):
+        """Test quantized mode loads the int8 ONNX export"""
+        st_module = Mock()
+        with patch.dict("sys.modules", {"sentence_transformers": st_module}):
+            provider = SentenceTransformerProvider(quantized=True)
+
+        st_module.SentenceTransformer.assert_called_once_with(
+            "all-MiniLM-L6-v2",
+            backend="onnx",
+            model_kwargs={"file_name": SentenceTransformerProvider.QUANTIZED_ONNX_FILE},
+        )
+        assert provider.quantized
+
+    def test_sentence_transformer_quantized_needs_onnx_backend(self):
+        """Test quantized mode on sentence-transformers without backend= support"""
+        st_module = Mock()
+        st_module.SentenceTransformer.side_effect = TypeError("unexpected keyword argument 'backend'")
+        with patch.dict("sys.modules", {"sentence_transformers": st_module}):
+            with pytest.raises(ImportError, match="sentence-transformers>=3.2"):
+                SentenceTransformerProvider(quantized=True)
+
+    def test_model2vec_provider(self):
+        """Test Model2Vec provider returns float32 rows from one encode call"""
+        m2v_module = Mock()
+        model = m2v_module.StaticModel.from_pretrained.return_value
+        model.dim = 2
+        model.encode.return_value = np.array([[0.5, 0.25], [1.0, 0.0]])
+        with patch.dict("sys.modules", {"model2vec": m2v_module}):
+            provider = Model2VecProvider()
+
+        m2v_module.StaticModel.from_pretrained.assert_called_once_with("minishlab/potion-base-8M")
+        assert provider.get_dimension() == 2
+        assert provider.embed_batch(["a", "b"]) == [[0.5, 0.25], [1.0, 0.0]]
+        model.encode.assert_called_once_with(["a", "b"])
+
+    def test_model2vec_selected_by_env(self, monkeypatch):
+        """Test EMBEDDING_PROVIDER=model2vec takes precedence in auto-detection"""
+        monkeypatch.setenv("EMBEDDING_PROVIDER", "model2vec")
+        m2v_module = Mock()
+        m2v_module.StaticModel.from_pretrained.return_value.dim = 256
+        with patch.dict("sys.modules", {"model2vec": m2v_module}):
+            service = EmbeddingService()
+
+        assert isinstance(service.provider, Model2VecProvider)
+        assert service.get_dimension() == 256
+
+    def test_model2vec_requested_but_missing(self, monkeypatch):
+        """Test an explicitly requested provider that can't load is an error, not a fallback"""
+        monkeypatch.setenv("EMBEDDING_PROVIDER", "model2vec")
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        with patch.dict("sys.modules", {"model2vec": None}):
+            with pytest.raises(RuntimeError, match="model2vec"):
+                EmbeddingService()
+
 
 # ============================================================================
 # Semantic Deduplication Tests
@@ -256,6 +411,57 @@ class TestSemanticDeduplicator:
 
         # Should create collection if not exists
         mock_qdrant_client.create_collection.assert_called_once()
+        hnsw_config = mock_qdrant_client.create_collection.call_args.kwargs["hnsw_config"]
+        assert (hnsw_config.m, hnsw_config.ef_construct) == (24, 128)
+        quantization = mock_qdrant_client.create_collection.call_args.kwargs["quantization_config"]
+        assert quantization.scalar.always_ram
+        mock_qdrant_client.create_payload_index.assert_called_once()
+        assert mock_qdrant_client.create_payload_index.call_args.kwargs["field_name"] == "timestamp_ns"
+
+    def test_search_filter_window(self, semantic_dedup):
+        """Test searches are limited to the dedup window when configured"""
+        assert semantic_dedup._search_filter() is None
+
+        semantic_dedup.window_days = 7
+        condition = semantic_dedup._search_filter().must[0]
+        cutoff = datetime.now(timezone.utc) - timedelta(days=7)
+
+        assert condition.key == "timestamp_ns"
+        assert abs(condition.range.gte - cutoff.timestamp() * 1e9) < 60 * 1e9
+
+    def test_epoch_ns(self):
+        """Test epoch-ns conversion is exact and treats naive datetimes as UTC"""
+        dt = datetime(2024, 1, 15, 10, 0, 0, 123456, tzinfo=timezone.utc)
+
+        assert _epoch_ns(dt) == 1705312800_123456000
+        assert _epoch_ns(dt.replace(tzinfo=None)) == _epoch_ns(dt)
+
+    def test_client_uses_http_by_default(self, embedding_service, monkeypatch):
+        """Test gRPC is opt-in, so deployments exposing only the REST port keep working"""
+        monkeypatch.delenv("QDRANT_PREFER_GRPC", raising=False)
+        with patch("packages.memory.semantic_dedup.QdrantClient") as client_cls:
+            SemanticDeduplicator(qdrant_url="http://qdrant:6333", embedding_service=embedding_service)
+
+        client_cls.assert_called_once_with(
+            url="http://qdrant:6333",
+            prefer_grpc=False,
+            grpc_port=6334,
+            grpc_options=None,
+        )
+
+    def test_client_prefers_grpc(self, embedding_service, monkeypatch):
+        """Test QDRANT_PREFER_GRPC creates the client with a keep-alive gRPC channel"""
+        monkeypatch.setenv("QDRANT_PREFER_GRPC", "true")
+        with patch("packages.memory.semantic_dedup.QdrantClient") as client_cls:
+            SemanticDeduplicator(qdrant_url="http://qdrant:6333", embedding_service=embedding_service)
+
+        client_cls.assert_called_once_with(
+            url="http://qdrant:6333",
+            prefer_grpc=True,
+            grpc_port=6334,
+            grpc_options=SemanticDeduplicator.GRPC_OPTIONS,
+        )
+        assert SemanticDeduplicator.GRPC_OPTIONS["grpc.keepalive_time_ms"] == 30_000
 
     def test_generate_search_text(self, semantic_dedup, sample_item):
         """Test search text generation"""
@@ -274,6 +480,10 @@ class TestSemanticDeduplicator:
         assert not result.is_duplicate
         assert result.max_similarity == 0.0
         assert len(result.similar_items) == 0
+        # Only the fields needed to build SimilarItems are fetched
+        assert mock_qdrant_client.search.call_args.kwargs["with_payload"] == [
+            "fingerprint", "title", "source", "timestamp_utc"
+        ]
 
     def test_check_duplicate_found(self, semantic_dedup, sample_item, mock_qdrant_client):
         """Test check_duplicate when similar item found"""
@@ -328,6 +538,26 @@ class TestSemanticDeduplicator:
         assert "user_123_items" in call_args.kwargs["collection_name"]
         assert len(call_args.kwargs["points"]) == 1
 
+    def test_add_item_brief_item_timestamp(self, semantic_dedup, mock_qdrant_client):
+        """Test points are built from a real BriefItem's ISO string timestamp"""
+        item = make_brief_item("1", "SpaceX launches Starship", timestamp_utc="2024-01-15T10:00:00.123456Z")
+
+        semantic_dedup.add_item("user123", item, "test_fp")
+
+        payload = mock_qdrant_client.upsert.call_args.kwargs["points"][0].payload
+        assert payload["timestamp_utc"] == "2024-01-15T10:00:00.123456+00:00"
+        assert payload["timestamp_ns"] == 1705312800_123456000
+
+    def test_point_id_is_stable_uint64(self):
+        """Test point IDs are deterministic across processes and fit Qdrant's uint64"""
+        point_id = SemanticDeduplicator._point_id("test_fp")
+
+        assert point_id == int.from_bytes(
+            hashlib.blake2b(b"test_fp", digest_size=8).digest(), "big"
+        )
+        assert 0 <= point_id < 2**64
+        assert point_id != SemanticDeduplicator._point_id("other_fp")
+
     def test_check_and_add_not_duplicate(
         self, semantic_dedup, sample_item, mock_qdrant_client
     ):
@@ -359,19 +589,108 @@ class TestSemanticDeduplicator:
         # Should NOT add to database (duplicate)
         mock_qdrant_client.upsert.assert_not_called()
 
+    @requires_search_batch
     def test_batch_check_duplicates(
-        self, semantic_dedup, sample_item, similar_item, mock_qdrant_client
+        self, semantic_dedup, sample_item, similar_item, mock_qdrant_client, mock_embedding_provider
     ):
         """Test batch duplicate checking"""
-        mock_qdrant_client.search.return_value = []
+        mock_embedding_provider.embed_batch.return_value = [[0.1] * 384, [0.2, -0.2] * 192]
+        mock_qdrant_client.search_batch.return_value = [[], []]
 
         items = [(sample_item, "fp1"), (similar_item, "fp2")]
         results = semantic_dedup.batch_check_duplicates("user123", items)
 
         assert len(results) == 2
         assert all(not r.is_duplicate for r in results)
-        # Should add both items
+        # Should add both items in one upsert
+        mock_qdrant_client.upsert.assert_called_once()
+
+    def test_find_cross_source_duplicates(self, semantic_dedup, mock_embedding_provider):
+        """Test clustering embeds all items in one batch"""
+        vectors = {
+            "Apple releases iPhone": [1.0, 0.0],
+            "New iPhone from Apple": [0.99, 0.1],
+            "Rain expected tomorrow": [0.0, 1.0],
+        }
+        mock_embedding_provider.get_dimension.return_value = 2
+        mock_embedding_provider.embed_batch.side_effect = lambda texts: [vectors[t] for t in texts]
+        items = [
+            Mock(title=title, summary=None, source=source)
+            for title, source in zip(vectors, ["techcrunch", "verge", "weather"])
+        ]
+
+        clusters = semantic_dedup.find_cross_source_duplicates("user123", items)
+
+        assert list(clusters.values()) == [items[:2]]
+        mock_embedding_provider.embed_batch.assert_called_once()
+        mock_embedding_provider.embed_text.assert_not_called()
+
+    @requires_search_batch
+    def test_batch_check_duplicates_embeds_once(
+        self, semantic_dedup, mock_embedding_provider, mock_qdrant_client
+    ):
+        """Test batch checking uses one embedding call, one search RPC and one upsert"""
+        mock_embedding_provider.embed_batch.return_value = [[0.1] * 384, [0.2, -0.2] * 192]
+        mock_qdrant_client.search_batch.return_value = [[], []]
+        items = [
+            (make_brief_item("1", "First story"), "fp1"),
+            (make_brief_item("2", "Second story"), "fp2"),
+        ]
+
+        results = semantic_dedup.batch_check_duplicates("user123", items)
+
+        assert [r.is_duplicate for r in results] == [False, False]
+        mock_embedding_provider.embed_batch.assert_called_once()
+        mock_embedding_provider.embed_text.assert_not_called()
+        mock_qdrant_client.search.assert_not_called()
+        requests = mock_qdrant_client.search_batch.call_args.kwargs["requests"]
+        assert len(requests) == 2
+        assert requests[0].params.hnsw_ef == 100
+        assert requests[0].with_payload == ["fingerprint", "title", "source", "timestamp_utc"]
+        mock_qdrant_client.upsert.assert_called_once()
+        # Vectors are L2-normalized once and reused for search and upsert
+        upserted = [p.vector for p in mock_qdrant_client.upsert.call_args.kwargs["points"]]
+        unit = 1 / np.sqrt(384)
+        assert upserted == [pytest.approx([unit] * 384), pytest.approx([unit, -unit] * 192)]
+        assert requests[1].vector == upserted[1]
+
+    @requires_search_batch
+    def test_batch_check_duplicates_within_batch(
+        self, semantic_dedup, mock_embedding_provider, mock_qdrant_client
+    ):
+        """Test near-duplicates inside one batch are caught before they reach Qdrant"""
+        mock_embedding_provider.embed_batch.return_value = [[0.1] * 384, [0.2] * 384]
+        mock_qdrant_client.search_batch.return_value = [[], []]
+        items = [
+            (make_brief_item("1", "Apple releases iPhone", source="techcrunch"), "fp1"),
+            (make_brief_item("2", "New iPhone from Apple", source="verge"), "fp2"),
+        ]
+
+        results = semantic_dedup.batch_check_duplicates("user123", items)
+
+        assert not results[0].is_duplicate
+        assert results[1].is_duplicate
+        assert results[1].similar_items[0].fingerprint == "fp1"
+        assert results[1].similar_items[0].timestamp_utc == datetime(2024, 1, 15, 10, tzinfo=timezone.utc)
+        assert len(mock_qdrant_client.upsert.call_args.kwargs["points"]) == 1
+
+    def test_batch_check_duplicates_without_search_batch(
+        self, semantic_dedup, mock_embedding_provider, mock_qdrant_client
+    ):
+        """Test clients without search_batch fall back to one check_and_add per item"""
+        del mock_qdrant_client.search_batch
+        mock_embedding_provider.embed_batch.return_value = [[0.1] * 384, [0.2, -0.2] * 192]
+        items = [
+            (make_brief_item("1", "First story"), "fp1"),
+            (make_brief_item("2", "Second story"), "fp2"),
+        ]
+
+        results = semantic_dedup.batch_check_duplicates("user123", items)
+
+        assert [r.is_duplicate for r in results] == [False, False]
+        assert mock_qdrant_client.search.call_count == 2
         assert mock_qdrant_client.upsert.call_count == 2
+        mock_embedding_provider.embed_batch.assert_called_once()
 
     def test_get_stats(self, semantic_dedup, mock_qdrant_client):
         """Test getting collection statistics"""
@@ -628,6 +947,47 @@ class TestEnhancedNoveltyDetector:
         # With entity tracking, this should detect an update
         assert result.entity_updates is not None
 
+    def test_detect_novelty_batch_checks_semantics_once(self):
+        """Test batch detection sends all NEW items to one semantic batch check"""
+        items = [
+            Mock(
+                source="news",
+                type="article",
+                item_ref=str(i),
+                novelty=NoveltyInfo(label=label, reason="base", first_seen_utc="2024-01-15T10:00:00+00:00"),
+            )
+            for i, label in enumerate(["NEW", "REPEAT", "NEW"])
+        ]
+        base_detector = Mock()
+        base_detector.detect_novelty_batch.return_value = items
+        semantic = Mock()
+        semantic.batch_check_duplicates.return_value = [
+            SemanticDuplicateResult(False, [], 0.0, "No similar items found"),
+            SemanticDuplicateResult(
+                True,
+                [SimilarItem("existing_fp", 0.92, "Launch", "techcrunch", datetime.now(timezone.utc))],
+                0.92,
+                "Similar to 'Launch'",
+            ),
+        ]
+        tracker = Mock()
+        tracker.track_item.return_value = Mock(has_updates=False)
+        detector = EnhancedNoveltyDetector(
+            novelty_detector=base_detector,
+            semantic_deduplicator=semantic,
+            entity_tracker=tracker,
+        )
+
+        result = detector.detect_novelty_batch("user123", items)
+
+        semantic.batch_check_duplicates.assert_called_once_with(
+            "user123", [(items[0], "news:0"), (items[2], "news:2")]
+        )
+        semantic.check_and_add.assert_not_called()
+        assert tracker.track_item.call_count == 3
+        assert [item.novelty.label for item in result] == ["NEW", "REPEAT", "SEMANTIC_DUPLICATE"]
+        assert result[2].novelty.similar_to == "existing_fp"
+
     def test_filter_by_novelty_default(self, enhanced_detector, sample_item, mock_qdrant_client):
         """Test default filtering (excludes REPEAT + SEMANTIC_DUPLICATE)"""
         mock_qdrant_client.search.return_value = []
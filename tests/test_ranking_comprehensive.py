@@ -8,38 +8,55 @@ from packages.ranking.features import FeatureExtractor
 from packages.shared.schemas import BriefItem, NoveltyInfo, RankingScores, Entity
 
 
+_NOW = datetime.now(timezone.utc)
+_NOW_ISO = _NOW.isoformat()
+_RECENT_ISO = (_NOW - timedelta(minutes=5)).isoformat()
+_OLD_ISO = (_NOW - timedelta(days=5)).isoformat()
+
+_PROTO_NOVELTY_NEW = NoveltyInfo(label='NEW', reason='Test', first_seen_utc=_NOW_ISO)
+_PROTO_NOVELTY_REPEAT = NoveltyInfo(label='REPEAT', reason='Test', first_seen_utc=_NOW_ISO)
+
+# Validated once; sample_items copies it and overrides the per-item fields
+_PROTO_ITEM = BriefItem(
+    item_ref='proto',
+    source='gmail',
+    type='email',
+    timestamp_utc=_NOW_ISO,
+    title='Test',
+    summary='Summary',
+    why_it_matters='Test',
+    entities=[],
+    novelty=_PROTO_NOVELTY_NEW,
+    ranking=RankingScores(
+        relevance_score=0.5,
+        urgency_score=0.5,
+        credibility_score=0.5,
+        impact_score=0.5,
+        actionability_score=0.5,
+        final_score=0.5
+    ),
+    evidence=[],
+    suggested_actions=[]
+)
+
+
 @pytest.fixture
 def sample_items():
     """Create sample items for ranking"""
-    items = []
-    for i in range(10):
-        item = BriefItem(
-            item_ref=f'item_{i}',
-            source='gmail',
-            type='email',
-            timestamp_utc=(datetime.now(timezone.utc) - timedelta(hours=i)).isoformat(),
-            title=f'Test {i}',
-            summary=f'Summary {i}',
-            why_it_matters='Test',
-            entities=[Entity(kind='person', key=f'person{i}')],
-            novelty=NoveltyInfo(
-                label='NEW' if i < 5 else 'REPEAT',
-                reason='Test',
-                first_seen_utc=datetime.now(timezone.utc).isoformat()
-            ),
-            ranking=RankingScores(
-                relevance_score=0.5,
-                urgency_score=0.5,
-                credibility_score=0.5,
-                impact_score=0.5,
-                actionability_score=0.5,
-                final_score=0.5
-            ),
-            evidence=[],
-            suggested_actions=[]
-        )
-        items.append(item)
-    return items
+    now = datetime.now(timezone.utc)
+    return [
+        _PROTO_ITEM.model_copy(update={
+            'item_ref': f'item_{i}',
+            'timestamp_utc': (now - timedelta(hours=i)).isoformat(),
+            'title': f'Test {i}',
+            'summary': f'Summary {i}',
+            'entities': [Entity(kind='person', key=f'person{i}')],
+            'novelty': _PROTO_NOVELTY_NEW if i < 5 else _PROTO_NOVELTY_REPEAT,
+            'evidence': [],
+            'suggested_actions': [],
+        })
+        for i in range(10)
+    ]
 
 
 class TestRanker:
@@ -88,7 +105,7 @@ class TestRanker:
         ranker = Ranker()
         ranked = ranker.rank_items(sample_items)
         scores = [item.ranking.final_score for item in ranked]
-        assert scores == sorted(scores, reverse=True)
+        assert all(a >= b for a, b in zip(scores, scores[1:]))
         
     def test_rank_items_empty(self):
         """Test ranking empty list"""
@@ -146,6 +163,7 @@ class TestFeatureExtractor:
             'projects': ['Project X']
         }
         extractor = FeatureExtractor(user_preferences=prefs)
+        assert extractor.preferences == prefs
         assert 'ai' in extractor.topics
         assert 'machine learning' in extractor.topics
         assert 'boss@company.com' in extractor.vip_people
@@ -187,42 +205,6 @@ class TestFeatureExtractor:
         extractor = FeatureExtractor()
         score = extractor.extract_impact(sample_items[0])
         assert 0.0 <= score <= 1.0
-        
-    def test_feature_extractor_with_preferences(self):
-        """Test feature extractor with preferences"""
-        prefs = {'topics': ['AI']}
-        extractor = FeatureExtractor(user_preferences=prefs)
-        assert extractor.preferences == prefs
-        
-    def test_extract_relevance(self, sample_items):
-        """Test relevance extraction"""
-        extractor = FeatureExtractor()
-        score = extractor.extract_relevance(sample_items[0])
-        assert 0 <= score <= 1
-        
-    def test_extract_urgency(self, sample_items):
-        """Test urgency extraction"""
-        extractor = FeatureExtractor()
-        score = extractor.extract_urgency(sample_items[0])
-        assert 0 <= score <= 1
-        
-    def test_extract_credibility(self, sample_items):
-        """Test credibility extraction"""
-        extractor = FeatureExtractor()
-        score = extractor.extract_credibility(sample_items[0])
-        assert 0 <= score <= 1
-        
-    def test_extract_actionability(self, sample_items):
-        """Test actionability extraction"""
-        extractor = FeatureExtractor()
-        score = extractor.extract_actionability(sample_items[0])
-        assert 0 <= score <= 1
-        
-    def test_extract_impact(self, sample_items):
-        """Test impact extraction"""
-        extractor = FeatureExtractor()
-        score = extractor.extract_impact(sample_items[0])
-        assert 0 <= score <= 1
 
 
 class TestRankingWeights:
@@ -262,12 +244,12 @@ class TestRankingScenarios:
             item_ref='recent',
             source='gmail',
             type='email',
-            timestamp_utc=(datetime.now(timezone.utc) - timedelta(minutes=5)).isoformat(),
+            timestamp_utc=_RECENT_ISO,
             title='Urgent',
             summary='Urgent email',
             why_it_matters='Test',
             entities=[],
-            novelty=NoveltyInfo(label='NEW', reason='Test', first_seen_utc=datetime.now(timezone.utc).isoformat()),
+            novelty=NoveltyInfo(label='NEW', reason='Test', first_seen_utc=_NOW_ISO),
             ranking=RankingScores(relevance_score=0.5, urgency_score=0.5, credibility_score=0.5, impact_score=0.5, actionability_score=0.5, final_score=0.5),
             evidence=[],
             suggested_actions=[]
@@ -277,12 +259,12 @@ class TestRankingScenarios:
             item_ref='old',
             source='gmail',
             type='email',
-            timestamp_utc=(datetime.now(timezone.utc) - timedelta(days=5)).isoformat(),
+            timestamp_utc=_OLD_ISO,
             title='Old',
             summary='Old email',
             why_it_matters='Test',
             entities=[],
-            novelty=NoveltyInfo(label='REPEAT', reason='Test', first_seen_utc=datetime.now(timezone.utc).isoformat()),
+            novelty=NoveltyInfo(label='REPEAT', reason='Test', first_seen_utc=_NOW_ISO),
             ranking=RankingScores(relevance_score=0.5, urgency_score=0.5, credibility_score=0.5, impact_score=0.5, actionability_score=0.5, final_score=0.5),
             evidence=[],
             suggested_actions=[]
@@ -300,12 +282,12 @@ class TestRankingScenarios:
             item_ref='new',
             source='gmail',
             type='email',
-            timestamp_utc=datetime.now(timezone.utc).isoformat(),
+            timestamp_utc=_NOW_ISO,
             title='New',
             summary='New email',
             why_it_matters='Test',
             entities=[],
-            novelty=NoveltyInfo(label='NEW', reason='Test', first_seen_utc=datetime.now(timezone.utc).isoformat()),
+            novelty=NoveltyInfo(label='NEW', reason='Test', first_seen_utc=_NOW_ISO),
             ranking=RankingScores(relevance_score=0.5, urgency_score=0.5, credibility_score=0.5, impact_score=0.5, actionability_score=0.5, final_score=0.5),
             evidence=[],
             suggested_actions=[]
@@ -315,12 +297,12 @@ class TestRankingScenarios:
             item_ref='repeat',
             source='gmail',
             type='email',
-            timestamp_utc=datetime.now(timezone.utc).isoformat(),
+            timestamp_utc=_NOW_ISO,
             title='Repeat',
             summary='Repeat email',
             why_it_matters='Test',
             entities=[],
-            novelty=NoveltyInfo(label='REPEAT', reason='Test', first_seen_utc=datetime.now(timezone.utc).isoformat()),
+            novelty=NoveltyInfo(label='REPEAT', reason='Test', first_seen_utc=_NOW_ISO),
             ranking=RankingScores(relevance_score=0.5, urgency_score=0.5, credibility_score=0.5, impact_score=0.5, actionability_score=0.5, final_score=0.5),
             evidence=[],
             suggested_actions=[]
@@ -330,9 +312,8 @@ class TestRankingScenarios:
         ranked = ranker.rank_items([repeat_item, new_item])
         
         # NEW item should have higher score (may not always be first due to other factors)
-        new_score = next(item.ranking.final_score for item in ranked if item.item_ref == 'new')
-        repeat_score = next(item.ranking.final_score for item in ranked if item.item_ref == 'repeat')
-        assert new_score >= repeat_score
+        scores = {item.item_ref: item.ranking.final_score for item in ranked}
+        assert scores['new'] >= scores['repeat']
         
     def test_rank_with_user_preferences(self):
         """Test ranking with user topic preferences"""
@@ -342,12 +323,12 @@ class TestRankingScenarios:
             item_ref='relevant',
             source='gmail',
             type='email',
-            timestamp_utc=datetime.now(timezone.utc).isoformat(),
+            timestamp_utc=_NOW_ISO,
             title='AI and machine learning breakthrough',
             summary='Latest AI research',
             why_it_matters='Test',
             entities=[Entity(kind='topic', key='AI')],
-            novelty=NoveltyInfo(label='NEW', reason='Test', first_seen_utc=datetime.now(timezone.utc).isoformat()),
+            novelty=NoveltyInfo(label='NEW', reason='Test', first_seen_utc=_NOW_ISO),
             ranking=RankingScores(relevance_score=0.5, urgency_score=0.5, credibility_score=0.5, impact_score=0.5, actionability_score=0.5, final_score=0.5),
             evidence=[],
             suggested_actions=[]
@@ -357,12 +338,12 @@ class TestRankingScenarios:
             item_ref='irrelevant',
             source='gmail',
             type='email',
-            timestamp_utc=datetime.now(timezone.utc).isoformat(),
+            timestamp_utc=_NOW_ISO,
             title='Cooking recipes',
             summary='New recipes',
             why_it_matters='Test',
             entities=[],
-            novelty=NoveltyInfo(label='NEW', reason='Test', first_seen_utc=datetime.now(timezone.utc).isoformat()),
+            novelty=NoveltyInfo(label='NEW', reason='Test', first_seen_utc=_NOW_ISO),
             ranking=RankingScores(relevance_score=0.5, urgency_score=0.5, credibility_score=0.5, impact_score=0.5, actionability_score=0.5, final_score=0.5),
             evidence=[],
             suggested_actions=[]
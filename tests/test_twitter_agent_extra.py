@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timezone
@@ -91,6 +92,23 @@ class TestTwitterAgentExtra:
         result = await agent.fetch_user_posts("testuser", limit=2)
         assert len(result) == 2
 
+    @pytest.mark.asyncio
+    async def test_twitter_extract_posts_concurrently(self):
+        agent = TwitterAgent()
+        
+        # The first element finishes last; results must still follow element order
+        async def mock_extract(el):
+            if el == "slow":
+                await asyncio.sleep(0.01)
+            if el == "bad":
+                raise ValueError("broken tweet")
+            return None if el == "empty" else {'id': el, 'content': 'concurrent test'}
+        
+        agent._extract_post_from_element = mock_extract
+        
+        result = await agent._extract_posts(["slow", "bad", "empty", "fast"], "timeline")
+        assert [post['id'] for post in result] == ["slow", "fast"]
+
     @pytest.mark.asyncio
     async def test_twitter_extract_post_complex(self):
         agent = TwitterAgent()
@@ -116,16 +134,15 @@ class TestTwitterAgentExtra:
         mock_like = AsyncMock()
         mock_like.inner_text.return_value = "5.2M"
         
-        def mock_query_selector(selector):
-            if "tweetText" in selector: return mock_text_el
-            if "User-Name" in selector: return mock_author_el
-            if "/status/" in selector: return mock_link_el
-            if "reply" in selector: return mock_reply
-            if "retweet" in selector: return mock_retweet
-            if "like" in selector: return mock_like
-            return None
-            
-        mock_element.query_selector.side_effect = mock_query_selector
+        elements_by_selector = {
+            '[data-testid="tweetText"]': mock_text_el,
+            '[data-testid="User-Name"]': mock_author_el,
+            'a[href*="/status/"]': mock_link_el,
+            '[data-testid="reply"]': mock_reply,
+            '[data-testid="retweet"]': mock_retweet,
+            '[data-testid="like"]': mock_like,
+        }
+        mock_element.query_selector.side_effect = elements_by_selector.get
         
         result = await agent._extract_post_from_element(mock_element)
         
@@ -191,12 +208,10 @@ class TestTwitterAgentExtra:
         # 3. a[href...] -> None
         # 4. reply -> mock_metrics_el
         
-        async def side_effect(selector):
-            if selector == '[data-testid="tweetText"]': return mock_text_el
-            if selector == '[data-testid="reply"]': return mock_metrics_el
-            return None
-            
-        mock_element.query_selector.side_effect = side_effect
+        mock_element.query_selector.side_effect = {
+            '[data-testid="tweetText"]': mock_text_el,
+            '[data-testid="reply"]': mock_metrics_el,
+        }.get
         
         post = await twitter_agent._extract_post_from_element(mock_element)
         assert post is not None
@@ -219,14 +234,19 @@ class TestTwitterAgentExtra:
         result = await agent._extract_post_from_element(mock_element)
         assert result['id'].startswith("unknown_")
 
-    def test_twitter_parse_metric_variants(self):
-        agent = TwitterAgent()
-        assert agent._parse_metric("100") == 100
-        assert agent._parse_metric("1.2K") == 1200
-        assert agent._parse_metric("3.5M") == 3500000
-        assert agent._parse_metric("invalid") == 0
-        assert agent._parse_metric("") == 0
-        assert agent._parse_metric("   ") == 0
+    @pytest.mark.parametrize("raw,expected", [
+        ("100", 100),
+        ("1.2K", 1200),
+        ("3.5M", 3_500_000),
+        ("invalid", 0),
+        ("", 0),
+        ("   ", 0),
+        ("1,234", 1234),
+        ("2b", 2_000_000_000),
+        ("K", 0),
+    ])
+    def test_twitter_parse_metric(self, twitter_agent, raw, expected):
+        assert twitter_agent._parse_metric(raw) == expected
 
     @pytest.mark.asyncio
     async def test_twitter_extract_post_timestamp_success(self, twitter_agent, mock_page):
@@ -242,12 +262,10 @@ class TestTwitterAgentExtra:
         mock_time_el = AsyncMock()
         mock_time_el.get_attribute.return_value = "2023-11-20T10:00:00.000Z"
         
-        async def side_effect(selector):
-            if selector == '[data-testid="tweetText"]': return mock_text_el
-            if selector == 'time': return mock_time_el
-            return None
-        
-        mock_element.query_selector.side_effect = side_effect
+        mock_element.query_selector.side_effect = {
+            '[data-testid="tweetText"]': mock_text_el,
+            'time': mock_time_el,
+        }.get
         
         post = await twitter_agent._extract_post_from_element(mock_element)
         assert post is not None